@@ -18,6 +18,7 @@ REPORTS_DIR = OUTPUTS_DIR / "reports"
 LOGS_DIR = OUTPUTS_DIR / "logs"
 PREVIEWS_DIR = OUTPUTS_DIR / "previews"
 SLIDESPECS_DIR = OUTPUTS_DIR / "slidespecs"
+LLM_CACHE_DIR = OUTPUTS_DIR / "llm_cache"
 
 
 class Settings:
@@ -29,6 +30,21 @@ class Settings:
         self.openai_base_url: Optional[str] = os.getenv("OPENAI_BASE_URL")
         self.openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
+        # Upper bound on concurrent requests when generation is split into batches
+        self.llm_max_concurrency: int = max(1, int(os.getenv("LLM_MAX_CONCURRENCY", "4")))
+        # Max slides per LLM request (0 = limited by the token budget only)
+        self.llm_slides_per_batch: int = max(0, int(os.getenv("LLM_SLIDES_PER_BATCH", "0")))
+        # Upper bound on one batched generation, retries included, before falling back
+        self.llm_timeout_seconds: float = max(1.0, float(os.getenv("LLM_TIMEOUT_SECONDS", "300")))
+        # Constrain replies with a strict JSON schema (needs an endpoint that supports it)
+        self.llm_json_schema: bool = os.getenv("LLM_JSON_SCHEMA", "false").lower() == "true"
+        # Reuse responses for byte-identical requests across runs (development aid)
+        self.llm_response_cache: bool = os.getenv("LLM_RESPONSE_CACHE", "false").lower() == "true"
+        # Ask streams for a final usage chunk; off by default for custom endpoints,
+        # some of which reject stream_options outright
+        default_stream_usage = "false" if self.openai_base_url else "true"
+        self.llm_stream_usage: bool = os.getenv("LLM_STREAM_USAGE", default_stream_usage).lower() == "true"
+
         # Feature flags
         self.enable_llm: bool = os.getenv("ENABLE_LLM", "false").lower() == "true"
         self.default_locale: str = os.getenv("DEFAULT_LOCALE", "zh-CN")
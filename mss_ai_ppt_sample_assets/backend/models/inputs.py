@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import Counter
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List
 
 import json
+import orjson
 from pydantic import BaseModel
 
 
@@ -26,3 +29,34 @@ class TenantInput(BaseModel):
 
     def get(self, key: str, default=None):
         return self.raw.get(key, default)
+
+    @cached_property
+    def raw_json(self) -> str:
+        """Indented JSON of the full raw input, serialized once for prompt building."""
+        return orjson.dumps(self.raw, option=orjson.OPT_INDENT_2).decode()
+
+    # Top-level sections, normalised once so explicit nulls read as empty
+    @cached_property
+    def tenant(self) -> Dict[str, Any]:
+        return self.raw.get("tenant") or {}
+
+    @cached_property
+    def period(self) -> Dict[str, Any]:
+        return self.raw.get("period") or {}
+
+    @cached_property
+    def incidents(self) -> List[Dict[str, Any]]:
+        return self.raw.get("incidents") or []
+
+    @cached_property
+    def incident_severity_counts(self) -> Counter:
+        """Count incidents by severity in a single pass (computed once per input)."""
+        return Counter(i.get("severity") for i in self.incidents)
+
+    @cached_property
+    def incident_summary(self) -> Dict[str, int]:
+        """Incident total and high-severity count, shared by generation and validation."""
+        return {
+            "incidents_count": len(self.incidents),
+            "incidents_high_count": self.incident_severity_counts.get("high", 0),
+        }
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import json
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 # ============================================================================
@@ -30,11 +30,13 @@ class SlideSpecV2(BaseModel):
     template_id: str
     slides: List[SlideContentV2]
 
+    # slide_key -> position in slides, built lazily by get_slide
+    _slide_index: Optional[Dict[str, int]] = PrivateAttr(default=None)
+
     @classmethod
     def load_from_file(cls, path: Path) -> "SlideSpecV2":
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        # Parse and validate in one pass, without an intermediate dict
+        return cls.model_validate_json(path.read_bytes())
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -42,11 +44,23 @@ class SlideSpecV2(BaseModel):
             json.dump(self.model_dump(), f, ensure_ascii=False, indent=2)
 
     def get_slide(self, slide_key: str) -> Optional[SlideContentV2]:
-        """Get a slide by its key."""
-        for slide in self.slides:
-            if slide.slide_key == slide_key:
-                return slide
-        return None
+        """Get a slide by its key.
+
+        Lookups go through a slide_key -> index map; an entry that no longer
+        matches (slides replaced or reordered) triggers a rebuild.
+        """
+        slides = self.slides
+        if self._slide_index is not None:
+            idx = self._slide_index.get(slide_key)
+            if idx is not None and idx < len(slides) and slides[idx].slide_key == slide_key:
+                return slides[idx]
+
+        index: Dict[str, int] = {}
+        for i, slide in enumerate(slides):
+            index.setdefault(slide.slide_key, i)
+        self._slide_index = index
+        idx = index.get(slide_key)
+        return slides[idx] if idx is not None else None
 
     def get_placeholder_value(self, slide_key: str, token: str) -> Optional[Any]:
         """Get a specific placeholder value."""
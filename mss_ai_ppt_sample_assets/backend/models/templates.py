@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal, Union
 
-from pydantic import BaseModel, Field, validator
-import json
+from pydantic import BaseModel, Field, field_validator, validator
 
 
 # ============================================================================
@@ -32,6 +32,9 @@ class PlaceholderDefinition(BaseModel):
     # Validation
     validation: Optional[str] = None  # Field to validate against input data
 
+    # Owning slide, stamped by SlideDefinitionV2 on load (not part of descriptor JSON)
+    parent_slide_key: Optional[str] = Field(default=None, exclude=True)
+
     # Table-specific
     columns: Optional[List[str]] = None  # Column names for table type
 
@@ -60,6 +63,23 @@ class PlaceholderDefinition(BaseModel):
     # }
 
 
+    @cached_property
+    def format_kind(self) -> Optional[str]:
+        """Classify ``format`` once for value formatting.
+
+        Returns:
+            "percent", "join_comma", "template" (contains {field} references),
+            "literal" (any other string) or None when no format is set
+        """
+        fmt = self.format
+        if not fmt:
+            return None
+        if fmt in ("percent", "join_comma"):
+            return fmt
+        if "{" in fmt:
+            return "template"
+        return "literal"
+
 class SlideDefinitionV2(BaseModel):
     """Slide definition for V2 templates."""
     slide_no: int
@@ -67,6 +87,15 @@ class SlideDefinitionV2(BaseModel):
     title: str
     placeholders: List[PlaceholderDefinition]
 
+    @field_validator("placeholders")
+    @classmethod
+    def stamp_parent_slide_key(cls, placeholders: List[PlaceholderDefinition], info) -> List[PlaceholderDefinition]:
+        """Record the owning slide_key on each placeholder."""
+        slide_key = info.data.get("slide_key")
+        for ph in placeholders:
+            ph.parent_slide_key = slide_key
+        return placeholders
+
 
 class TemplateDescriptorV2(BaseModel):
     """Template descriptor for V2 AI-driven templates."""
@@ -81,40 +110,81 @@ class TemplateDescriptorV2(BaseModel):
 
     @classmethod
     def load_from_file(cls, path: Path) -> "TemplateDescriptorV2":
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        return cls.model_validate_json(path.read_bytes())
 
     @validator("slides", pre=True)
     def sort_slides(cls, slides: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Ensure slides are ordered by slide_no."""
         return sorted(slides, key=lambda s: s.get("slide_no", 0))
 
-    def get_ai_placeholders(self) -> List[tuple[str, str, PlaceholderDefinition]]:
+    # Lookups derived from slides, built once per descriptor. Descriptors are
+    # cached by TemplateRepository and treated as read-only after loading.
+    @cached_property
+    def slides_by_key(self) -> Dict[str, SlideDefinitionV2]:
+        """Map slide_key to its slide definition (first one wins)."""
+        result: Dict[str, SlideDefinitionV2] = {}
+        for slide in self.slides:
+            result.setdefault(slide.slide_key, slide)
+        return result
+
+    @cached_property
+    def ai_placeholders_by_slide(self) -> Dict[str, List[PlaceholderDefinition]]:
+        """Map slide_key to its AI placeholders, in slide order; slides without any are omitted."""
+        result: Dict[str, List[PlaceholderDefinition]] = {}
+        for slide in self.slides:
+            ai_phs = [ph for ph in slide.placeholders if ph.ai_generate]
+            if ai_phs:
+                result[slide.slide_key] = ai_phs
+        return result
+
+    @cached_property
+    def placeholder_types_by_slide(self) -> Dict[str, Dict[str, str]]:
+        """Map slide_key to {token: placeholder type}, as used when rendering."""
+        return {
+            slide.slide_key: {ph.token: ph.type for ph in slide.placeholders}
+            for slide in self.slides
+        }
+
+    @cached_property
+    def ai_placeholders(self) -> List[PlaceholderDefinition]:
+        return [ph for s in self.slides for ph in s.placeholders if ph.ai_generate]
+
+    @cached_property
+    def data_placeholders(self) -> List[PlaceholderDefinition]:
+        return [ph for s in self.slides for ph in s.placeholders if not ph.ai_generate]
+
+    def get_slide(self, slide_key: str) -> Optional[SlideDefinitionV2]:
+        """Get a slide definition by its key."""
+        return self.slides_by_key.get(slide_key)
+
+    def get_ai_placeholders(self) -> List[PlaceholderDefinition]:
         """Get all placeholders that require AI generation.
 
         Returns:
-            List of (slide_key, token, placeholder_definition) tuples
+            Flat list of placeholder definitions in slide order; each carries
+            its slide via ``parent_slide_key``. The list is shared, do not
+            mutate it.
         """
-        result = []
-        for slide in self.slides:
-            for ph in slide.placeholders:
-                if ph.ai_generate:
-                    result.append((slide.slide_key, ph.token, ph))
-        return result
+        return self.ai_placeholders
+
+    def get_ai_placeholders_grouped(self) -> Dict[str, List[PlaceholderDefinition]]:
+        """Get AI placeholders grouped by slide_key (for per-slide prompts).
 
-    def get_data_placeholders(self) -> List[tuple[str, str, PlaceholderDefinition]]:
+        Returns:
+            Dict mapping slide_key to its AI placeholder definitions;
+            slides without AI placeholders are omitted
+        """
+        return self.ai_placeholders_by_slide
+
+    def get_data_placeholders(self) -> List[PlaceholderDefinition]:
         """Get all placeholders that extract data directly.
 
         Returns:
-            List of (slide_key, token, placeholder_definition) tuples
+            Flat list of placeholder definitions in slide order; each carries
+            its slide via ``parent_slide_key``. The list is shared, do not
+            mutate it.
         """
-        result = []
-        for slide in self.slides:
-            for ph in slide.placeholders:
-                if not ph.ai_generate:
-                    result.append((slide.slide_key, ph.token, ph))
-        return result
+        return self.data_placeholders
 
     def get_validation_fields(self) -> Dict[str, str]:
         """Get all fields that need validation.
@@ -148,8 +218,5 @@ def load_template_descriptor(path: Path) -> TemplateDescriptorV2:
     Returns:
         TemplateDescriptorV2
     """
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-
     # Simplified check or just direct validation
-    return TemplateDescriptorV2.model_validate(data)
\ No newline at end of file
+    return TemplateDescriptorV2.model_validate_json(path.read_bytes())
\ No newline at end of file
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import hashlib
 import json
 import logging
+import random
 import re
-import time
-from typing import Any, Dict, List, Optional
-
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError
+import ssl
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import AbstractSet, Any, Awaitable, Dict, FrozenSet, List, Optional, Tuple, TypeVar
+
+import orjson
+from openai import (
+    AsyncOpenAI, OpenAI, APIError, RateLimitError, APIConnectionError, DefaultAsyncHttpxClient
+)
 
 from mss_ai_ppt_sample_assets.backend import config
 from mss_ai_ppt_sample_assets.backend.models.slidespec import (
@@ -17,16 +27,328 @@ from mss_ai_ppt_sample_assets.backend.models.templates import (
 )
 from mss_ai_ppt_sample_assets.backend.models.inputs import TenantInput
 from mss_ai_ppt_sample_assets.backend.modules.template_loader import TemplateRepository
+from mss_ai_ppt_sample_assets.backend.modules.validator import NUMBER_RE
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Default response_format: any JSON object, shape described by the prompt
+_JSON_OBJECT_FORMAT: Dict[str, Any] = {"type": "json_object"}
+
+# Separator line framing API call logs
+_LOG_RULE = "=" * 80
+
+# Prefix for list values rendered as bullet text
+_BULLET = "• "
+
+# Default display names for severity-keyed pie chart categories
+_DEFAULT_SEVERITY_NAMES = {
+    'critical': '严重',
+    'high': '高危',
+    'medium': '中危',
+    'low': '低危',
+    'info': '信息',
+}
+
+# Markdown code fence around an LLM JSON payload
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+
+# {path} references inside placeholder format templates
+_FORMAT_PATH_RE = re.compile(r"\{([^}]+)\}")
+
+
+_T = TypeVar("_T")
+
+# Shared V2 client state. Building a client (and its SSL context) is costly
+# and pooled connections are only reused when one client serves all
+# requests, so every LLMOrchestratorV2 shares a client per endpoint, driven
+# from one long-lived event loop (an httpx pool is bound to its loop).
+_CLIENT_CACHE: Dict[tuple, AsyncOpenAI] = {}
+_CLIENT_LOCK = threading.Lock()
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_async_client(api_key: Optional[str], base_url: Optional[str]) -> AsyncOpenAI:
+    """Return the process-wide AsyncOpenAI client for (api_key, base_url)."""
+    global _SSL_CONTEXT
+    key = (api_key, base_url)
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            if _SSL_CONTEXT is None:
+                _SSL_CONTEXT = ssl.create_default_context()
+            client_kwargs: Dict[str, Any] = {
+                "api_key": api_key,
+                "http_client": DefaultAsyncHttpxClient(verify=_SSL_CONTEXT),
+            }
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            client = AsyncOpenAI(**client_kwargs)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def _run_async(coro: Awaitable[_T], timeout: Optional[float] = None) -> _T:
+    """Run a coroutine on the shared background event loop and wait for it.
+
+    If it does not finish within timeout seconds it is cancelled and
+    concurrent.futures.TimeoutError is raised, so a stalled stream cannot
+    block the calling thread forever.
+    """
+    global _LOOP
+    with _CLIENT_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="llm-orchestrator-loop", daemon=True).start()
+    future = asyncio.run_coroutine_threadsafe(coro, _LOOP)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a dotted path into (part, list index or None) pairs, cached.
+
+    Paths come from placeholder sources and format templates, so the same
+    few strings are resolved over and over.
+    """
+    return tuple((part, int(part) if part.isdecimal() else None) for part in path.split('.'))
+
+
+def _get_path(root: Dict[str, Any], path: str) -> Any:
+    """Walk a dotted path (list indices allowed) from an input dict root.
+
+    Callers that already hold the raw dict use this directly, skipping the
+    TenantInput unwrapping done by LLMOrchestratorV2._get_nested.
+    """
+    current: Any = root
+    for part, idx in _split_path(path):
+        if isinstance(current, dict):
+            current = current.get(part)
+        elif idx is not None and isinstance(current, list):
+            current = current[idx] if idx < len(current) else None
+        else:
+            return None
+        if current is None:
+            return None
+    return current
+
+
+@lru_cache(maxsize=256)
+def _split_format_template(template: str) -> Tuple[str, ...]:
+    """Split a format template into alternating literal and {path} segments.
+
+    Odd indices hold the paths; format strings come from the small, fixed
+    template vocabulary, so the split is cached.
+    """
+    return tuple(_FORMAT_PATH_RE.split(template))
+
+
+def _response_cache_path(
+    model: str,
+    system_prompt: str,
+    user_prompts: List[str],
+    response_format: Dict[str, Any],
+) -> Path:
+    """Location of the cached completion for an exact (model, messages) request."""
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, *user_prompts):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(orjson.dumps(response_format, option=orjson.OPT_SORT_KEYS))
+    return config.LLM_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _store_cached_response(path: Path, content: str) -> None:
+    """Write a completion to the response cache; failures only cost a future hit."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning("Failed to write LLM response cache %s: %s", path.name, e)
+
+
+# Upper bound for a single retry wait, computed or server-provided
+_MAX_RETRY_DELAY = 60.0
+
+
+def _retry_after_seconds(error: APIError) -> Optional[float]:
+    """Return the server's Retry-After delay in seconds, if it sent a usable one."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form is not worth parsing for a rate limit hint
+        return None
+    if seconds < 0:
+        return None
+    return min(seconds, _MAX_RETRY_DELAY)
+
+
+@lru_cache(maxsize=1024)
+def _referenced_sections(instruction: str, sections: Tuple[str, ...]) -> FrozenSet[str]:
+    """Top-level input sections an AI instruction names (e.g. 'alerts.total', 'incidents[0]')."""
+    return frozenset(
+        key for key in sections
+        if re.search(rf"(?<![A-Za-z0-9_]){re.escape(key)}(?![A-Za-z0-9_])", instruction)
+    )
+
+
+def _format_percent(value: Any) -> Any:
+    """Render a numeric ratio as a whole percentage; other values pass through."""
+    if isinstance(value, (int, float)):
+        return f"{int(value * 100)}%"
+    return value
+
+
+def _extract_first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, or None if there is none.
+
+    Single forward pass tracking brace depth and JSON string state, so braces
+    inside string values and chatter after the object are handled correctly.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for pos in range(start, len(text)):
+        ch = text[pos]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
+
 
 class LLMGenerationError(Exception):
     """Error during LLM content generation"""
     pass
 
 
+class _SlideStreamParser:
+    """Incrementally extract slide objects from a streamed {"slides": [...]} reply.
+
+    Deltas are fed as they arrive; each slide object is decoded as soon as
+    its closing brace is seen, so parsing overlaps the transfer instead of
+    starting after it. ``complete`` is set once the top-level object closes
+    with every slide decoded; otherwise callers parse the full text.
+    """
+
+    _SPECIAL_RE = re.compile(r'[\\"{}\[\]]')
+    _SLIDES_KEY_RE = re.compile(r'"slides"\s*:\s*$')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.slides: Dict[str, Dict[str, Any]] = {}
+        self.complete = False
+        self._failed = False
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._in_slides = False
+        self._saw_slides = False
+        self._slide_parts: Optional[List[str]] = None
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        if self.complete or self._failed:
+            return
+
+        stack = self._stack
+        skip_until = 0
+        slide_start = 0 if self._slide_parts is not None else None
+        if self._escape:
+            # Backslash ended the previous chunk; this chunk's first char is escaped
+            self._escape = False
+            skip_until = 1
+
+        for match in self._SPECIAL_RE.finditer(chunk):
+            pos = match.start()
+            if pos < skip_until:
+                continue
+            ch = match.group()
+
+            if self._in_string:
+                if ch == "\\":
+                    if pos + 1 < len(chunk):
+                        skip_until = pos + 2
+                    else:
+                        self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == "[":
+                if stack == ["{"] and not self._in_slides:
+                    self._in_slides = bool(self._SLIDES_KEY_RE.search(self._tail + chunk[:pos]))
+                    self._saw_slides = self._saw_slides or self._in_slides
+                stack.append(ch)
+            elif ch == "{":
+                if self._in_slides and stack == ["{", "["]:
+                    self._slide_parts = []
+                    slide_start = pos
+                stack.append(ch)
+            else:
+                if not stack:
+                    self._failed = True
+                    return
+                stack.pop()
+                if ch == "}" and self._slide_parts is not None and stack == ["{", "["]:
+                    self._slide_parts.append(chunk[slide_start:pos + 1])
+                    self._add_slide("".join(self._slide_parts))
+                    self._slide_parts = None
+                    slide_start = None
+                elif ch == "]" and stack == ["{"]:
+                    self._in_slides = False
+                elif not stack:
+                    self.complete = self._saw_slides and not self._failed
+                    self._failed = not self.complete
+                    return
+
+        if self._slide_parts is not None and slide_start is not None:
+            self._slide_parts.append(chunk[slide_start:])
+        self._tail = (self._tail + chunk)[-64:]
+
+    def _add_slide(self, text: str) -> None:
+        try:
+            slide_data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            self._failed = True
+            return
+        slide_key = slide_data.get("slide_key")
+        if slide_key:
+            self.slides[slide_key] = slide_data.get("placeholders", {})
+
+
 class LLMOrchestratorV2:
     """V2 Orchestrator for AI-driven content generation.
 
@@ -39,17 +361,19 @@ class LLMOrchestratorV2:
 
     def __init__(self, template_repo: Optional[TemplateRepository] = None):
         self.template_repo = template_repo or TemplateRepository()
-        self.client: Optional[OpenAI] = None
+        self.client: Optional[AsyncOpenAI] = None
+        # (template_id, slide_keys) -> (descriptor, prompt skeleton)
+        self._skeleton_cache: Dict[tuple, tuple] = {}
+        self._response_format_cache: Dict[tuple, tuple] = {}
 
         if config.settings.enable_llm:
             try:
-                client_kwargs = {"api_key": config.settings.openai_api_key}
-                if config.settings.openai_base_url:
-                    client_kwargs["base_url"] = config.settings.openai_base_url
-                self.client = OpenAI(**client_kwargs)
+                self.client = _get_shared_async_client(
+                    config.settings.openai_api_key, config.settings.openai_base_url
+                )
                 logger.info("OpenAI client initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
+                logger.error("Failed to initialize OpenAI client: %s", e)
                 raise LLMGenerationError(f"OpenAI client initialization failed: {e}") from e
 
     def _get_nested(self, data: Any, path: str) -> Any:
@@ -65,31 +389,19 @@ class LLMOrchestratorV2:
         else:
             return None
 
-        for part in path.split('.'):
-            if isinstance(current, dict):
-                current = current.get(part)
-            elif isinstance(current, list) and part.isdigit():
-                idx = int(part)
-                current = current[idx] if idx < len(current) else None
-            else:
-                return None
-            if current is None:
-                return None
-        return current
+        return _get_path(current, path)
 
     def _resolve_format_path(self, data: Dict[str, Any], path: str) -> Any:
         """Resolve a dotted path in data, handling .length for lists."""
-        parts = path.split('.')
         current = data
 
-        for i, part in enumerate(parts):
+        for part, idx in _split_path(path):
             if part == "length" and isinstance(current, list):
                 return len(current)
 
             if isinstance(current, dict):
                 current = current.get(part)
-            elif isinstance(current, list) and part.isdigit():
-                idx = int(part)
+            elif isinstance(current, list) and idx is not None:
                 current = current[idx] if idx < len(current) else None
             else:
                 return None
@@ -101,18 +413,16 @@ class LLMOrchestratorV2:
 
     def _format_template_string(self, template: str, data: Dict[str, Any]) -> str:
         """Format a template string with custom path resolution supporting .length."""
-        import re
+        parts = _split_format_template(template)
+        if len(parts) == 1:
+            return template
 
-        def replace_placeholder(match):
-            path = match.group(1)
-            value = self._resolve_format_path(data, path)
-            if value is None:
-                return match.group(0)  # Keep original if not found
-            return str(value)
-
-        # Find all {path} patterns and replace them
-        result = re.sub(r'\{([^}]+)\}', replace_placeholder, template)
-        return result
+        out = list(parts)
+        for i in range(1, len(parts), 2):
+            value = self._resolve_format_path(data, parts[i])
+            # Keep original if not found
+            out[i] = "{" + parts[i] + "}" if value is None else str(value)
+        return "".join(out)
 
     def _format_value(self, value: Any, placeholder: PlaceholderDefinition) -> str:
         """Format a value according to placeholder definition."""
@@ -120,53 +430,57 @@ class LLMOrchestratorV2:
             return placeholder.default or ""
 
         # Apply transform
-        if placeholder.transform:
-            if placeholder.transform == "uppercase":
+        transform = placeholder.transform
+        if transform:
+            if transform == "uppercase":
                 value = str(value).upper()
-            elif placeholder.transform == "lowercase":
+            elif transform == "lowercase":
                 value = str(value).lower()
-            elif placeholder.transform == "percent":
+            elif transform == "percent":
                 if isinstance(value, (int, float)):
                     value = f"{round(value * 100)}%"
 
+        # Format type is classified once per placeholder definition
+        kind = placeholder.format_kind
+
         # Handle list values FIRST (before format check)
         if isinstance(value, list):
-            if placeholder.format and "{" in placeholder.format:
+            if kind == "template":
                 # Format each list item using the format template
                 formatted_items = []
+                _append = formatted_items.append
+                _format_item = self._format_template_string
+                item_format = placeholder.format
                 for item in value:
                     if isinstance(item, dict):
                         try:
-                            formatted_items.append(self._format_template_string(placeholder.format, item))
+                            _append(_format_item(item_format, item))
                         except Exception:
-                            formatted_items.append(str(item))
+                            _append(str(item))
                     else:
-                        formatted_items.append(str(item))
-                return "\n".join(f"• {item}" for item in formatted_items)
-            elif placeholder.format == "join_comma":
-                return ", ".join(str(v) for v in value)
+                        _append(str(item))
+                return "\n".join([_BULLET + item for item in formatted_items])
+            elif kind == "join_comma":
+                return ", ".join([str(v) for v in value])
             else:
-                return "\n".join(f"• {str(v)}" for v in value)
+                return "\n".join([_BULLET + str(v) for v in value])
 
         # Apply format template for non-list values
-        if placeholder.format:
-            if placeholder.format == "percent":
-                if isinstance(value, (int, float)):
-                    return f"{round(value * 100)}%"
-            elif placeholder.format == "join_comma":
-                return str(value)
-            elif "{" in placeholder.format:
-                # Template format like "{value}小时" or "{start} ~ {end}"
-                if isinstance(value, dict):
-                    try:
-                        return self._format_template_string(placeholder.format, value)
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        return placeholder.format.format(value=value)
-                    except (KeyError, ValueError):
-                        pass
+        if kind == "percent":
+            if isinstance(value, (int, float)):
+                return f"{round(value * 100)}%"
+        elif kind == "template":
+            # Template format like "{value}小时" or "{start} ~ {end}"
+            if isinstance(value, dict):
+                try:
+                    return self._format_template_string(placeholder.format, value)
+                except Exception:
+                    pass
+            else:
+                try:
+                    return placeholder.format.format(value=value)
+                except (KeyError, ValueError):
+                    pass
 
         return str(value)
 
@@ -188,13 +502,13 @@ class LLMOrchestratorV2:
         """
         data_source = chart_config.get('data_source')
         if not data_source:
-            logger.warning(f"Chart config missing data_source")
+            logger.warning("Chart config missing data_source")
             return {}
 
         # Get data from tenant input
-        source_data = self._get_nested(tenant_input, data_source)
+        source_data = _get_path(tenant_input.raw, data_source)
         if not source_data:
-            logger.warning(f"No data found at {data_source}")
+            logger.warning("No data found at %s", data_source)
             return {}
 
         result = {
@@ -217,50 +531,39 @@ class LLMOrchestratorV2:
                 # List of objects format: [{"category": ..., "count": ...}, ...]
                 categories = []
                 values = []
+                # Bound once; the loop runs per data point
+                _get = dict.get
+                _append_category = categories.append
+                _append_value = values.append
                 for item in source_data:
                     if isinstance(item, dict):
-                        cat_value = item.get(x_field)
-                        val_value = item.get(y_field)
+                        cat_value = _get(item, x_field)
+                        val_value = _get(item, y_field)
                         if cat_value is not None:
-                            categories.append(cat_value)
-                            values.append(val_value if val_value is not None else 0)
+                            _append_category(cat_value)
+                            _append_value(val_value if val_value is not None else 0)
 
                 if categories:
                     result['categories'] = categories
                     result['series'] = [{'name': chart_config.get('series_name', '告警数'), 'values': values}]
                 else:
-                    logger.warning(f"Bar chart data source {data_source} list has no valid items with fields {x_field}/{y_field}")
+                    logger.warning("Bar chart data source %s list has no valid items with fields %s/%s", data_source, x_field, y_field)
                     return {}
             else:
-                logger.warning(f"Bar chart data source {data_source} is neither dict nor list")
+                logger.warning("Bar chart data source %s is neither dict nor list", data_source)
                 return {}
 
         elif chart_type == 'pie_chart':
             # Expect source_data to be a dict like {'high': 52, 'medium': 473, 'low': 816}
             if isinstance(source_data, dict):
-                # Convert dict to categories and values
-                categories = []
-                values = []
-
                 # Map severity levels to Chinese names
-                severity_map = chart_config.get('category_map', {
-                    'critical': '严重',
-                    'high': '高危',
-                    'medium': '中危',
-                    'low': '低危',
-                    'info': '信息'
-                })
-
-                for key, value in source_data.items():
-                    # Use mapped name if available, otherwise use key
-                    category_name = severity_map.get(key, key)
-                    categories.append(category_name)
-                    values.append(value)
+                severity_map = chart_config.get('category_map', _DEFAULT_SEVERITY_NAMES)
 
-                result['categories'] = categories
-                result['values'] = values
+                # Use mapped name if available, otherwise use key
+                result['categories'] = [severity_map.get(key, key) for key in source_data]
+                result['values'] = list(source_data.values())
             else:
-                logger.warning(f"Pie chart data source {data_source} is not a dict")
+                logger.warning("Pie chart data source %s is not a dict", data_source)
                 return {}
 
         return result
@@ -283,34 +586,35 @@ class LLMOrchestratorV2:
         columns_config = table_config.get('columns', [])
 
         if not data_source or not columns_config:
-            logger.warning(f"Table config missing data_source or columns")
+            logger.warning("Table config missing data_source or columns")
             return {}
 
         # Get data from tenant input
-        source_data = self._get_nested(tenant_input, data_source)
+        source_data = _get_path(tenant_input.raw, data_source)
         if not source_data or not isinstance(source_data, list):
-            logger.warning(f"No list data found at {data_source}")
+            logger.warning("No list data found at %s", data_source)
             return {}
 
         # Extract headers
         headers = [col.get('header', '') for col in columns_config]
 
+        # Resolve column fields and formats once, not per row
+        fields = [col.get('field', '') for col in columns_config]
+        percent_cols = [col.get('format') == 'percent' for col in columns_config]
+
         # Extract rows
-        rows = []
         max_rows = table_config.get('max_rows', 10)
-        for item in source_data[:max_rows]:
-            if isinstance(item, dict):
-                row = []
-                for col in columns_config:
-                    field_name = col.get('field', '')
-                    value = item.get(field_name, '')
-
-                    # Format value based on column config
-                    if col.get('format') == 'percent' and isinstance(value, (int, float)):
-                        value = f"{int(value * 100)}%"
-
-                    row.append(value)
-                rows.append(row)
+        items = [item for item in source_data[:max_rows] if isinstance(item, dict)]
+        if any(percent_cols):
+            rows = [
+                [
+                    _format_percent(item.get(field, '')) if percent else item.get(field, '')
+                    for field, percent in zip(fields, percent_cols)
+                ]
+                for item in items
+            ]
+        else:
+            rows = [[item.get(field, '') for field in fields] for item in items]
 
         return {
             'headers': headers,
@@ -318,32 +622,38 @@ class LLMOrchestratorV2:
             'position': table_config.get('position')
         }
 
+    def _compute_derived_values(self, tenant_input: TenantInput) -> Dict[str, Any]:
+        """Compute derived values addressable by placeholder source/validation paths."""
+        summary = tenant_input.incident_summary
+        return {
+            "incidents.length": summary["incidents_count"],
+            "incidents.high_count": summary["incidents_high_count"],
+            **summary,
+        }
+
     def _extract_data_placeholders(
         self,
         tenant_input: TenantInput,
         template: TemplateDescriptorV2,
+        computed: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """Extract all non-AI placeholders from input data.
 
+        Args:
+            tenant_input: Raw tenant input
+            template: Template descriptor
+            computed: Prebuilt output of _compute_derived_values (built if omitted)
+
         Returns:
             Dict[slide_key, Dict[token, value]]
         """
         result: Dict[str, Dict[str, Any]] = {}
+        raw = tenant_input.raw
+        if computed is None:
+            computed = self._compute_derived_values(tenant_input)
 
-        # Calculate derived values
-        incidents = tenant_input.get("incidents", []) or []
-        incidents_high_count = len([i for i in incidents if i.get("severity") == "high"])
-        incidents_count = len(incidents)
-
-        # Add computed values to a lookup dict
-        computed = {
-            "incidents.length": incidents_count,
-            "incidents.high_count": incidents_high_count,
-            "incidents_count": incidents_count,
-            "incidents_high_count": incidents_high_count,
-        }
-
-        for slide_key, token, placeholder in template.get_data_placeholders():
+        for placeholder in template.get_data_placeholders():
+            slide_key, token = placeholder.parent_slide_key, placeholder.token
             if slide_key not in result:
                 result[slide_key] = {}
 
@@ -372,7 +682,7 @@ class LLMOrchestratorV2:
                 if placeholder.source in computed:
                     value = computed[placeholder.source]
                 else:
-                    value = self._get_nested(tenant_input, placeholder.source)
+                    value = _get_path(raw, placeholder.source)
                 result[slide_key][token] = self._format_value(value, placeholder)
             else:
                 result[slide_key][token] = ""
@@ -414,61 +724,115 @@ class LLMOrchestratorV2:
 }}
 """
 
-    def _build_user_prompt(
+    def _build_response_format(
         self,
-        tenant_input: TenantInput,
-        template: TemplateDescriptorV2
+        template: TemplateDescriptorV2,
+        slide_keys: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the response_format for a request, cached per template and slides.
+
+        With LLM_JSON_SCHEMA enabled the reply is constrained to a strict
+        schema: each slide entry names one of the requested slides and must
+        carry exactly that slide's AI tokens as strings. Otherwise plain
+        json_object mode is used and the prompt describes the shape.
+        """
+        if not config.settings.llm_json_schema:
+            return _JSON_OBJECT_FORMAT
+
+        cache_key = (template.template_id, tuple(slide_keys) if slide_keys is not None else None)
+        cached = self._response_format_cache.get(cache_key)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+
+        selected = set(slide_keys) if slide_keys is not None else None
+        slide_schemas = []
+        for slide_key, ai_placeholders in template.ai_placeholders_by_slide.items():
+            if selected is not None and slide_key not in selected:
+                continue
+            tokens = [placeholder.token for placeholder in ai_placeholders]
+            slide_schemas.append({
+                "type": "object",
+                "properties": {
+                    "slide_key": {"type": "string", "enum": [slide_key]},
+                    "placeholders": {
+                        "type": "object",
+                        "properties": {token: {"type": "string"} for token in tokens},
+                        "required": tokens,
+                        "additionalProperties": False,
+                    },
+                },
+                "required": ["slide_key", "placeholders"],
+                "additionalProperties": False,
+            })
+
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "slidespec_v2",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "slides": {"type": "array", "items": {"anyOf": slide_schemas}},
+                    },
+                    "required": ["slides"],
+                    "additionalProperties": False,
+                },
+            },
+        }
+        self._response_format_cache[cache_key] = (template, response_format)
+        return response_format
+
+    def _get_instruction_skeleton(
+        self,
+        template: TemplateDescriptorV2,
+        slide_keys: Optional[List[str]] = None,
     ) -> str:
-        """Build the user prompt with data and AI instructions."""
-        tenant = tenant_input.get("tenant", {})
-        period = tenant_input.get("period", {})
+        """Get the template-only part of the user prompt, cached per template.
 
-        prompt_parts = [
-            "## 客户信息",
-            f"- 客户名称：{tenant.get('name', '')}",
-            f"- 行业：{tenant.get('industry', '')}",
-            f"- 地区：{tenant.get('region', '')}",
-            "",
-            "## 报告周期",
-            f"- 开始日期：{period.get('start', '')}",
-            f"- 结束日期：{period.get('end', '')}",
-            "",
-            "## 安全数据",
-            "```json",
-            json.dumps(tenant_input.raw, ensure_ascii=False, indent=2),
-            "```",
-            "",
-            "## 需要生成的内容",
-            "",
-        ]
-
-        # Add AI placeholder instructions
-        ai_placeholders = template.get_ai_placeholders()
-        current_slide = None
-
-        for slide_key, token, placeholder in ai_placeholders:
-            if slide_key != current_slide:
-                # Find slide title
-                for slide in template.slides:
-                    if slide.slide_key == slide_key:
-                        prompt_parts.append(f"### Slide: {slide.title} ({slide_key})")
-                        break
-                current_slide = slide_key
-
-            # Add placeholder instruction
-            constraints = []
-            if placeholder.max_length:
-                constraints.append(f"最多{placeholder.max_length}字")
-            if placeholder.max_items:
-                constraints.append(f"最多{placeholder.max_items}条")
-            if placeholder.max_chars_per_item:
-                constraints.append(f"每条最多{placeholder.max_chars_per_item}字")
-
-            constraint_str = f" ({', '.join(constraints)})" if constraints else ""
-
-            prompt_parts.append(f"\n**{token}**{constraint_str}")
-            prompt_parts.append(f"{placeholder.ai_instruction}")
-            prompt_parts.append("")
+        Covers the per-slide AI instructions and the opening of the expected
+        JSON structure; it depends only on the descriptor and the selected
+        slides, never on tenant data. Entries are tied to the descriptor
+        object, so a reloaded descriptor rebuilds them.
+
+        Args:
+            template: Template descriptor
+            slide_keys: Slides to include (all slides if None)
+        """
+        cache_key = (template.template_id, tuple(slide_keys) if slide_keys is not None else None)
+        cached = self._skeleton_cache.get(cache_key)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+
+        prompt_parts: List[str] = []
+        slide_examples = []
+
+        selected = set(slide_keys) if slide_keys is not None else None
+        for slide_key, ai_placeholders in template.ai_placeholders_by_slide.items():
+            if selected is not None and slide_key not in selected:
+                continue
+            slide = template.get_slide(slide_key)
+
+            prompt_parts.append(f"### Slide: {slide.title} ({slide.slide_key})")
+            for placeholder in ai_placeholders:
+                # Add placeholder instruction
+                constraints = []
+                if placeholder.max_length:
+                    constraints.append(f"最多{placeholder.max_length}字")
+                if placeholder.max_items:
+                    constraints.append(f"最多{placeholder.max_items}条")
+                if placeholder.max_chars_per_item:
+                    constraints.append(f"每条最多{placeholder.max_chars_per_item}字")
+
+                constraint_str = f" ({', '.join(constraints)})" if constraints else ""
+
+                prompt_parts.append(f"\n**{placeholder.token}**{constraint_str}")
+                prompt_parts.append(f"{placeholder.ai_instruction}")
+                prompt_parts.append("")
+
+            # Expected structure for this slide
+            tokens_str = ", ".join(f'"{ph.token}": "..."' for ph in ai_placeholders)
+            slide_examples.append(f'    {{"slide_key": "{slide.slide_key}", "placeholders": {{{tokens_str}}}}}')
 
         # Add output format reminder
         prompt_parts.extend([
@@ -477,49 +841,36 @@ class LLMOrchestratorV2:
             "```json",
             "{",
             '  "slides": [',
+            ",\n".join(slide_examples),
         ])
 
-        # Generate expected structure
-        slide_examples = []
-        for slide in template.slides:
-            ai_tokens = [ph.token for ph in slide.placeholders if ph.ai_generate]
-            if ai_tokens:
-                tokens_str = ", ".join(f'"{t}": "..."' for t in ai_tokens)
-                slide_examples.append(f'    {{"slide_key": "{slide.slide_key}", "placeholders": {{{tokens_str}}}}}')
-
-        prompt_parts.append(",\n".join(slide_examples))
-        prompt_parts.extend([
-            "  ],",
-            "}",
-            "```",
-        ])
-
-        return "\n".join(prompt_parts)
+        skeleton = "\n".join(prompt_parts)
+        self._skeleton_cache[cache_key] = (template, skeleton)
+        return skeleton
 
-    def _build_user_prompt_for_slides(
+    def _build_data_context(
         self,
         tenant_input: TenantInput,
-        template: TemplateDescriptorV2,
-        slide_keys: List[str],
-        batch_index: int = 0,
-        total_batches: int = 1,
+        sections: Optional[AbstractSet[str]] = None,
     ) -> str:
-        """Build user prompt for a subset of slides (for batched generation).
+        """Build the customer/period/data message for a run or a batch.
+
+        Serializing the raw input dominates prompt construction; the full
+        dump is cached on the TenantInput and callers reuse the context.
 
         Args:
             tenant_input: Raw tenant input data
-            template: Template descriptor
-            slide_keys: List of slide_keys to include in this batch
-            batch_index: Current batch index (0-based)
-            total_batches: Total number of batches
-
-        Returns:
-            User prompt string for the specified slides
+            sections: Top-level input keys to include (all if None)
         """
-        tenant = tenant_input.get("tenant", {})
-        period = tenant_input.get("period", {})
+        tenant = tenant_input.tenant
+        period = tenant_input.period
+        if sections is None:
+            raw_json = tenant_input.raw_json
+        else:
+            raw = {key: value for key, value in tenant_input.raw.items() if key in sections}
+            raw_json = orjson.dumps(raw, option=orjson.OPT_INDENT_2).decode()
 
-        prompt_parts = [
+        return "\n".join([
             "## 客户信息",
             f"- 客户名称：{tenant.get('name', '')}",
             f"- 行业：{tenant.get('industry', '')}",
@@ -531,10 +882,56 @@ class LLMOrchestratorV2:
             "",
             "## 安全数据",
             "```json",
-            json.dumps(tenant_input.raw, ensure_ascii=False, indent=2),
+            raw_json,
             "```",
-            "",
-        ]
+        ])
+
+    def _build_batch_data_context(
+        self,
+        tenant_input: TenantInput,
+        template: TemplateDescriptorV2,
+        slide_keys: List[str],
+        full_context: str,
+    ) -> str:
+        """Build the data message for one batch, slimmed to the sections it uses.
+
+        A batch gets only the input sections its AI instructions reference.
+        If any instruction names no section (open-ended analysis needs all
+        the data), or the batch needs every section anyway, the prebuilt
+        full context is returned.
+        """
+        all_sections = tuple(tenant_input.raw)
+        needed: set = set()
+        for slide_key in slide_keys:
+            for placeholder in template.ai_placeholders_by_slide.get(slide_key, ()):
+                found = _referenced_sections(placeholder.ai_instruction or "", all_sections)
+                if not found:
+                    return full_context
+                needed.update(found)
+
+        if len(needed) == len(all_sections):
+            return full_context
+        return self._build_data_context(tenant_input, needed)
+
+    def _build_task_prompt(
+        self,
+        template: TemplateDescriptorV2,
+        slide_keys: Optional[List[str]] = None,
+        batch_index: int = 0,
+        total_batches: int = 1,
+    ) -> str:
+        """Build the AI instruction message for all slides or a batch of slides.
+
+        Args:
+            template: Template descriptor
+            slide_keys: List of slide_keys to include (all slides if None)
+            batch_index: Current batch index (0-based)
+            total_batches: Total number of batches
+
+        Returns:
+            Instruction message sent after the data context message
+        """
+        prompt_parts: List[str] = []
 
         # Add batch info if there are multiple batches
         if total_batches > 1:
@@ -547,62 +944,8 @@ class LLMOrchestratorV2:
         prompt_parts.extend([
             "## 需要生成的内容",
             "",
-        ])
-
-        # Get AI placeholders only for specified slides
-        ai_placeholders = template.get_ai_placeholders()
-        current_slide = None
-
-        for slide_key, token, placeholder in ai_placeholders:
-            # Skip slides not in this batch
-            if slide_key not in slide_keys:
-                continue
-
-            if slide_key != current_slide:
-                # Find slide title
-                for slide in template.slides:
-                    if slide.slide_key == slide_key:
-                        prompt_parts.append(f"### Slide: {slide.title} ({slide_key})")
-                        break
-                current_slide = slide_key
-
-            # Add placeholder instruction
-            constraints = []
-            if placeholder.max_length:
-                constraints.append(f"最多{placeholder.max_length}字")
-            if placeholder.max_items:
-                constraints.append(f"最多{placeholder.max_items}条")
-            if placeholder.max_chars_per_item:
-                constraints.append(f"每条最多{placeholder.max_chars_per_item}字")
-
-            constraint_str = f" ({', '.join(constraints)})" if constraints else ""
-
-            prompt_parts.append(f"\n**{token}**{constraint_str}")
-            prompt_parts.append(f"{placeholder.ai_instruction}")
-            prompt_parts.append("")
-
-        # Add output format reminder
-        prompt_parts.extend([
-            "",
-            "## 请按以下JSON格式返回：",
-            "```json",
-            "{",
-            '  "slides": [',
-        ])
-
-        # Generate expected structure for only the specified slides
-        slide_examples = []
-        for slide in template.slides:
-            if slide.slide_key not in slide_keys:
-                continue
-            ai_tokens = [ph.token for ph in slide.placeholders if ph.ai_generate]
-            if ai_tokens:
-                tokens_str = ", ".join(f'"{t}": "..."' for t in ai_tokens)
-                slide_examples.append(f'    {{"slide_key": "{slide.slide_key}", "placeholders": {{{tokens_str}}}}}')
-
-        prompt_parts.append(",\n".join(slide_examples))
-        prompt_parts.extend([
-            "  ]",
+            self._get_instruction_skeleton(template, slide_keys),
+            "  ]," if slide_keys is None else "  ]",
             "}",
             "```",
         ])
@@ -625,16 +968,15 @@ class LLMOrchestratorV2:
     ) -> int:
         """Estimate the instruction size for a slide's AI placeholders."""
         size = 0
-        for slide in template.slides:
-            if slide.slide_key == slide_key:
-                # Add slide header
-                size += len(f"### Slide: {slide.title} ({slide_key})\n")
-                for ph in slide.placeholders:
-                    if ph.ai_generate and ph.ai_instruction:
-                        size += len(f"\n**{ph.token}**\n")
-                        size += len(ph.ai_instruction or "")
-                        size += 50  # constraints and formatting overhead
-                break
+        slide = template.get_slide(slide_key)
+        if slide is not None:
+            # Add slide header
+            size += len(f"### Slide: {slide.title} ({slide_key})\n")
+            for ph in slide.placeholders:
+                if ph.ai_generate and ph.ai_instruction:
+                    size += len(f"\n**{ph.token}**\n")
+                    size += len(ph.ai_instruction or "")
+                    size += 50  # constraints and formatting overhead
         return size
 
     def _get_smart_slide_batches(
@@ -642,40 +984,31 @@ class LLMOrchestratorV2:
         tenant_input: TenantInput,
         template: TemplateDescriptorV2,
         max_tokens_per_batch: int = 6000,
+        data_context: Optional[str] = None,
+        max_slides_per_batch: Optional[int] = None,
     ) -> List[List[str]]:
         """Split slides into batches based on estimated token count.
 
         This method intelligently groups slides to keep each batch under
-        the token limit, avoiding API timeouts.
+        the token limit, avoiding API timeouts. An optional slide cap splits
+        large batches further so they can be dispatched concurrently.
 
         Args:
             tenant_input: Raw tenant input data (needed for base prompt size)
             template: Template descriptor
             max_tokens_per_batch: Maximum estimated tokens per batch
+            data_context: Prebuilt output of _build_data_context (built if omitted)
+            max_slides_per_batch: Maximum slides per batch (settings value if
+                None; 0 means no cap)
 
         Returns:
             List of batches, where each batch is a list of slide_keys
         """
         # Calculate base prompt size (customer info + input data)
         # This is constant across all batches
-        tenant = tenant_input.get("tenant", {})
-        period = tenant_input.get("period", {})
-        base_prompt = "\n".join([
-            "## 客户信息",
-            f"- 客户名称：{tenant.get('name', '')}",
-            f"- 行业：{tenant.get('industry', '')}",
-            f"- 地区：{tenant.get('region', '')}",
-            "",
-            "## 报告周期",
-            f"- 开始日期：{period.get('start', '')}",
-            f"- 结束日期：{period.get('end', '')}",
-            "",
-            "## 安全数据",
-            "```json",
-            json.dumps(tenant_input.raw, ensure_ascii=False, indent=2),
-            "```",
-        ])
-        base_tokens = self._estimate_prompt_tokens(base_prompt)
+        if data_context is None:
+            data_context = self._build_data_context(tenant_input)
+        base_tokens = self._estimate_prompt_tokens(data_context)
 
         # Reserve tokens for JSON output format instructions (~500 tokens)
         format_overhead = 500
@@ -683,22 +1016,23 @@ class LLMOrchestratorV2:
         # Available tokens for slide instructions per batch
         available_tokens = max_tokens_per_batch - base_tokens - format_overhead
 
-        logger.info(f"📊 Batch sizing: base={base_tokens} tokens, available={available_tokens} tokens/batch")
+        logger.info("📊 Batch sizing: base=%d tokens, available=%d tokens/batch", base_tokens, available_tokens)
 
         # Calculate instruction size for each slide with AI placeholders
         slide_sizes: List[tuple] = []  # (slide_key, estimated_tokens)
-        for slide in template.slides:
-            ai_count = sum(1 for ph in slide.placeholders if ph.ai_generate)
-            if ai_count == 0:
-                continue
-            instruction_size = self._estimate_slide_instruction_size(slide.slide_key, template)
+        for slide_key in template.ai_placeholders_by_slide:
+            instruction_size = self._estimate_slide_instruction_size(slide_key, template)
             estimated_tokens = self._estimate_prompt_tokens(" " * instruction_size)
-            slide_sizes.append((slide.slide_key, estimated_tokens))
+            slide_sizes.append((slide_key, estimated_tokens))
+
+        if max_slides_per_batch is None:
+            max_slides_per_batch = config.settings.llm_slides_per_batch
+        slide_cap = max_slides_per_batch if max_slides_per_batch > 0 else len(slide_sizes)
 
         # If total is small enough, no batching needed
         total_instruction_tokens = sum(t for _, t in slide_sizes)
-        if total_instruction_tokens <= available_tokens:
-            logger.info(f"📦 No batching needed: {total_instruction_tokens} tokens fits in {available_tokens}")
+        if total_instruction_tokens <= available_tokens and len(slide_sizes) <= slide_cap:
+            logger.info("📦 No batching needed: %d tokens fits in %d", total_instruction_tokens, available_tokens)
             return [[s for s, _ in slide_sizes]]
 
         # Greedy batching: add slides until we exceed the limit
@@ -707,10 +1041,12 @@ class LLMOrchestratorV2:
         current_tokens = 0
 
         for slide_key, tokens in slide_sizes:
-            # If adding this slide would exceed the limit, start a new batch
-            if current_tokens + tokens > available_tokens and current_batch:
+            # If adding this slide would exceed either limit, start a new batch
+            if current_batch and (
+                current_tokens + tokens > available_tokens or len(current_batch) >= slide_cap
+            ):
                 batches.append(current_batch)
-                logger.info(f"  Batch {len(batches)}: {current_batch} (~{current_tokens} tokens)")
+                logger.info("  Batch %d: %s (~%d tokens)", len(batches), current_batch, current_tokens)
                 current_batch = []
                 current_tokens = 0
 
@@ -720,7 +1056,7 @@ class LLMOrchestratorV2:
         # Don't forget the last batch
         if current_batch:
             batches.append(current_batch)
-            logger.info(f"  Batch {len(batches)}: {current_batch} (~{current_tokens} tokens)")
+            logger.info("  Batch %d: %s (~%d tokens)", len(batches), current_batch, current_tokens)
 
         return batches
 
@@ -732,6 +1068,8 @@ class LLMOrchestratorV2:
     ) -> Dict[str, Dict[str, Any]]:
         """Generate AI content in batches to avoid timeout issues.
 
+        Batches are independent, so their requests run concurrently.
+
         Args:
             tenant_input: Raw tenant input data
             template: Template descriptor
@@ -740,114 +1078,234 @@ class LLMOrchestratorV2:
         Returns:
             Dict[slide_key, Dict[token, value]] with all AI-generated content
         """
-        batches = self._get_smart_slide_batches(tenant_input, template, max_tokens_per_batch)
+        timeout = config.settings.llm_timeout_seconds
+        try:
+            return _run_async(
+                self._agenerate_ai_content_in_batches(tenant_input, template, max_tokens_per_batch),
+                timeout=timeout,
+            )
+        except concurrent.futures.TimeoutError as e:
+            raise LLMGenerationError(f"AI content generation timed out after {timeout:.0f}s") from e
+
+    async def _agenerate_ai_content_in_batches(
+        self,
+        tenant_input: TenantInput,
+        template: TemplateDescriptorV2,
+        max_tokens_per_batch: int = 6000,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async implementation of _generate_ai_content_in_batches."""
+        # Shared customer/data block, serialized once for all batches
+        data_context = self._build_data_context(tenant_input)
+
+        batches = self._get_smart_slide_batches(
+            tenant_input, template, max_tokens_per_batch, data_context=data_context
+        )
         total_batches = len(batches)
+        system_prompt = self._build_system_prompt(template)
 
         if total_batches <= 1:
             # No need for batching, use original method
             logger.info("📦 Single batch - using standard generation")
-            system_prompt = self._build_system_prompt(template)
-            user_prompt = self._build_user_prompt(tenant_input, template)
-            response = self._call_openai_with_retry(system_prompt, user_prompt)
+            task_prompt = self._build_task_prompt(template)
+            parser = _SlideStreamParser()
+            response = await self._acall_openai_with_retry(
+                system_prompt,
+                [data_context, task_prompt],
+                stream_parser=parser,
+                response_format=self._build_response_format(template),
+            )
+            if parser.complete:
+                return parser.slides
             return self._parse_llm_response(response, template)
 
-        logger.info(f"📦 Smart batching: splitting into {total_batches} batches")
-
-        all_ai_placeholders: Dict[str, Dict[str, Any]] = {}
-        system_prompt = self._build_system_prompt(template)
+        logger.info("📦 Smart batching: splitting into %d batches", total_batches)
 
-        for i, batch_slide_keys in enumerate(batches):
-            logger.info(f"🔄 Processing batch {i + 1}/{total_batches}: slides {batch_slide_keys}")
+        semaphore = asyncio.Semaphore(config.settings.llm_max_concurrency)
 
-            user_prompt = self._build_user_prompt_for_slides(
-                tenant_input,
+        async def run_batch(i: int, batch_slide_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+            batch_context = self._build_batch_data_context(
+                tenant_input, template, batch_slide_keys, data_context
+            )
+            task_prompt = self._build_task_prompt(
                 template,
                 batch_slide_keys,
                 batch_index=i,
                 total_batches=total_batches,
             )
 
-            prompt_tokens = self._estimate_prompt_tokens(user_prompt)
-            logger.info(f"   Batch prompt size: ~{prompt_tokens} tokens")
-
-            response = self._call_openai_with_retry(system_prompt, user_prompt)
-            batch_placeholders = self._parse_llm_response(response, template)
-
-            # Merge batch results
+            async with semaphore:
+                logger.info("🔄 Processing batch %d/%d: slides %s", i + 1, total_batches, batch_slide_keys)
+                prompt_tokens = self._estimate_prompt_tokens(batch_context) + self._estimate_prompt_tokens(task_prompt)
+                logger.info("   Batch prompt size: ~%d tokens", prompt_tokens)
+
+                parser = _SlideStreamParser()
+                response = await self._acall_openai_with_retry(
+                    system_prompt,
+                    [batch_context, task_prompt],
+                    stream_parser=parser,
+                    response_format=self._build_response_format(template, batch_slide_keys),
+                )
+            if parser.complete:
+                batch_placeholders = parser.slides
+            else:
+                batch_placeholders = self._parse_llm_response(response, template)
+            logger.info("✅ Batch %d/%d completed", i + 1, total_batches)
+            return batch_placeholders
+
+        batch_results = await asyncio.gather(
+            *(run_batch(i, keys) for i, keys in enumerate(batches)),
+            return_exceptions=True,
+        )
+
+        # A failed batch only loses its own slides; they get fallback text later
+        failures: List[LLMGenerationError] = []
+        for i, r in enumerate(batch_results):
+            if isinstance(r, BaseException):
+                if not isinstance(r, LLMGenerationError):
+                    raise r
+                logger.error("❌ Batch %d/%d failed: %s", i + 1, total_batches, r)
+                failures.append(r)
+        if len(failures) == total_batches:
+            raise LLMGenerationError(f"All {total_batches} batches failed: {failures[0]}") from failures[0]
+
+        # Merge batch results in batch order
+        all_ai_placeholders: Dict[str, Dict[str, Any]] = {}
+        for batch_placeholders in batch_results:
+            if isinstance(batch_placeholders, BaseException):
+                continue
             for slide_key, tokens in batch_placeholders.items():
                 if slide_key not in all_ai_placeholders:
                     all_ai_placeholders[slide_key] = {}
                 all_ai_placeholders[slide_key].update(tokens)
 
-            logger.info(f"✅ Batch {i + 1}/{total_batches} completed")
-
         return all_ai_placeholders
 
-    def _call_openai_with_retry(
+    async def _acall_openai_with_retry(
         self,
         system_prompt: str,
-        user_prompt: str,
+        user_prompts: List[str],
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        stream_parser: Optional[_SlideStreamParser] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """Call OpenAI API with retry logic."""
+        """Call OpenAI API with retry logic, streaming the completion.
+
+        Each entry of user_prompts is sent as a separate user message, so the
+        shared data context is never concatenated with the instructions.
+        Deltas are collected as they arrive and joined once at the end; when
+        a stream_parser is given, each delta is also fed to it (it is reset
+        on every attempt).
+
+        response_format defaults to json_object mode.
+
+        With LLM_RESPONSE_CACHE enabled, a byte-identical earlier request is
+        answered from disk without calling the API.
+        """
         if not self.client:
             raise LLMGenerationError("OpenAI client is not initialized. Enable LLM in settings.")
 
-        logger.info("=" * 80)
+        if response_format is None:
+            response_format = _JSON_OBJECT_FORMAT
+
+        cache_path = None
+        if config.settings.llm_response_cache:
+            cache_path = _response_cache_path(
+                config.settings.openai_model, system_prompt, user_prompts, response_format
+            )
+            if cache_path.is_file():
+                content = cache_path.read_text(encoding="utf-8")
+                logger.info("♻️ Using cached LLM response %s", cache_path.name)
+                if stream_parser is not None:
+                    stream_parser.reset()
+                    stream_parser.feed(content)
+                return content
+
+        logger.info(_LOG_RULE)
         logger.info("CALLING OPENAI API (V2)")
-        logger.info(f"Model: {config.settings.openai_model}")
-        logger.info(f"System prompt length: {len(system_prompt)} chars")
-        logger.info(f"User prompt length: {len(user_prompt)} chars")
-        logger.info("=" * 80)
+        logger.info("Model: %s", config.settings.openai_model)
+        logger.info("System prompt length: %d chars", len(system_prompt))
+        logger.info("User prompt length: %d chars", sum(map(len, user_prompts)))
+        logger.info(_LOG_RULE)
+
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend({"role": "user", "content": p} for p in user_prompts)
+
+        # Only sent when enabled: endpoints that don't know stream_options
+        # answer with a 400, which is not retried
+        extra_kwargs: Dict[str, Any] = {}
+        if config.settings.llm_stream_usage:
+            extra_kwargs["stream_options"] = {"include_usage": True}
 
         last_error = None
         for attempt in range(max_retries):
             try:
-                logger.info(f"🔄 API Call Attempt {attempt + 1}/{max_retries}")
+                logger.info("🔄 API Call Attempt %d/%d", attempt + 1, max_retries)
 
-                response = self.client.chat.completions.create(
+                stream = await self.client.chat.completions.create(
                     model=config.settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
+                    messages=messages,
                     temperature=0.7,
-                    response_format={"type": "json_object"},
+                    response_format=response_format,
+                    stream=True,
+                    **extra_kwargs,
                 )
 
-                content = response.choices[0].message.content
+                if stream_parser is not None:
+                    stream_parser.reset()
+                chunks: List[str] = []
+                usage = None
+                async for chunk in stream:
+                    # With include_usage the final chunk carries usage and no
+                    # choices; other endpoints may attach it to any chunk or none
+                    if getattr(chunk, "usage", None) is not None:
+                        usage = chunk.usage
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            chunks.append(delta)
+                            if stream_parser is not None:
+                                stream_parser.feed(delta)
+
+                content = "".join(chunks)
                 if not content:
                     raise LLMGenerationError("OpenAI returned empty response")
 
-                logger.info("=" * 80)
+                logger.info(_LOG_RULE)
                 logger.info("✅ OPENAI API CALL SUCCESSFUL")
-                logger.info(f"Total tokens used: {response.usage.total_tokens}")
-                logger.info(f"Response length: {len(content)} chars")
-                logger.info("=" * 80)
+                if usage is not None:
+                    logger.info("Total tokens used: %d", usage.total_tokens)
+                logger.info("Response length: %d chars", len(content))
+                logger.info(_LOG_RULE)
+                if cache_path is not None:
+                    _store_cached_response(cache_path, content)
                 return content
 
             except RateLimitError as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    wait_time = retry_delay * (2 ** attempt)
-                    logger.warning(f"⚠️ Rate limit hit, waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                    wait_time = _retry_after_seconds(e)
+                    if wait_time is None:
+                        # Capped exponential backoff with jitter so concurrent
+                        # batches don't retry in lockstep
+                        wait_time = min(_MAX_RETRY_DELAY, retry_delay * (2 ** attempt) * (0.5 + random.random()))
+                    logger.warning("⚠️ Rate limit hit, waiting %.1fs...", wait_time)
+                    await asyncio.sleep(wait_time)
 
             except APIConnectionError as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    logger.warning(f"⚠️ Connection error: {e}, retrying...")
-                    time.sleep(retry_delay)
+                    logger.warning("⚠️ Connection error: %s, retrying...", e)
+                    await asyncio.sleep(retry_delay)
 
             except APIError as e:
                 last_error = e
-                logger.error(f"❌ OpenAI API error: {e}")
+                logger.error("❌ OpenAI API error: %s", e)
                 break
 
             except Exception as e:
                 last_error = e
-                logger.error(f"❌ Unexpected error: {e}")
+                logger.error("❌ Unexpected error: %s", e)
                 break
 
         raise LLMGenerationError(f"Failed after {max_retries} attempts: {last_error}") from last_error
@@ -860,15 +1318,14 @@ class LLMOrchestratorV2:
         text = content.strip()
 
         # Remove markdown code fences
-        fenced_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", text, re.IGNORECASE)
+        fenced_match = _FENCED_JSON_RE.search(text)
         if fenced_match:
             text = fenced_match.group(1).strip()
 
         # Extract JSON object
-        first_brace = text.find("{")
-        last_brace = text.rfind("}")
-        if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-            return text[first_brace:last_brace + 1].strip()
+        json_object = _extract_first_json_object(text)
+        if json_object is not None:
+            return json_object
 
         return text
 
@@ -882,14 +1339,24 @@ class LLMOrchestratorV2:
         Returns:
             Dict[slide_key, Dict[token, value]]
         """
-        cleaned = self._sanitize_llm_json(response)
+        # Fast path: with a JSON response_format the reply is normally a
+        # bare object, so fence stripping and brace scanning can be skipped
+        data = None
+        if response.lstrip().startswith("{"):
+            try:
+                data = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                data = None
 
-        try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            logger.error(f"Response: {cleaned[:500]}...")
-            raise LLMGenerationError(f"Invalid JSON from LLM: {e}") from e
+        if not isinstance(data, dict):
+            cleaned = self._sanitize_llm_json(response)
+
+            try:
+                data = orjson.loads(cleaned)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse LLM response: %s", e)
+                logger.error("Response: %.500s...", cleaned)
+                raise LLMGenerationError(f"Invalid JSON from LLM: {e}") from e
 
         result: Dict[str, Dict[str, Any]] = {}
 
@@ -909,7 +1376,8 @@ class LLMOrchestratorV2:
         self,
         slidespec: SlideSpecV2,
         tenant_input: TenantInput,
-        template: TemplateDescriptorV2
+        template: TemplateDescriptorV2,
+        computed: Optional[Dict[str, Any]] = None,
     ) -> List[str]:
         """Validate key numerical fields match input data.
 
@@ -918,42 +1386,41 @@ class LLMOrchestratorV2:
         """
         errors = []
         validation_fields = template.get_validation_fields()
-
-        # Computed values
-        incidents = tenant_input.get("incidents", []) or []
-        computed = {
-            "incidents_count": len(incidents),
-            "incidents_high_count": len([i for i in incidents if i.get("severity") == "high"]),
-        }
+        raw = tenant_input.raw
+        if computed is None:
+            computed = self._compute_derived_values(tenant_input)
+
+        # token -> values of that token across slides, in slide order
+        token_values: Dict[str, List[Any]] = {token: [] for token in validation_fields}
+        for slide in slidespec.slides:
+            for token, value in slide.placeholders.items():
+                values = token_values.get(token)
+                if values is not None:
+                    values.append(value)
 
         for token, field_path in validation_fields.items():
             # Get expected value
             if field_path in computed:
                 expected = computed[field_path]
             else:
-                expected = self._get_nested(tenant_input, field_path)
+                expected = _get_path(raw, field_path)
 
             if expected is None:
                 continue
 
-            # Find actual value in slidespec
-            for slide in slidespec.slides:
-                if token in slide.placeholders:
-                    actual = slide.placeholders[token]
-
-                    # Extract number from string if needed
-                    if isinstance(actual, str):
-                        numbers = re.findall(r'[\d.]+', actual)
-                        if numbers:
-                            try:
-                                actual = float(numbers[0]) if '.' in numbers[0] else int(numbers[0])
-                            except ValueError:
-                                pass
-
-                    # Compare
-                    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
-                        if abs(expected - actual) > 0.01:
-                            errors.append(f"{token}: expected {expected}, got {actual}")
+            # Check every occurrence of the token in the slidespec
+            for actual in token_values[token]:
+                # Extract number from string if needed
+                if isinstance(actual, str):
+                    match = NUMBER_RE.search(actual)
+                    if match:
+                        number = match.group()
+                        actual = float(number) if '.' in number else int(number)
+
+                # Compare
+                if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+                    if abs(expected - actual) > 0.01:
+                        errors.append(f"{token}: expected {expected}, got {actual}")
 
         return errors
 
@@ -975,7 +1442,7 @@ class LLMOrchestratorV2:
         Returns:
             SlideSpecV2 with all placeholders filled
         """
-        logger.info(f"🎯 Generating V2 slidespec for template: {template_id}, use_mock={use_mock}")
+        logger.info("🎯 Generating V2 slidespec for template: %s, use_mock=%s", template_id, use_mock)
 
         # Load V2 template descriptor
         template = self.template_repo.get_descriptor_v2(template_id)
@@ -986,7 +1453,8 @@ class LLMOrchestratorV2:
 
         # Step 1: Extract data placeholders (non-AI)
         logger.info("📊 Extracting data placeholders...")
-        data_placeholders = self._extract_data_placeholders(tenant_input, template)
+        computed = self._compute_derived_values(tenant_input)
+        data_placeholders = self._extract_data_placeholders(tenant_input, template, computed)
 
         for slide_key, tokens in data_placeholders.items():
             slide = slidespec.get_slide(slide_key)
@@ -994,37 +1462,52 @@ class LLMOrchestratorV2:
                 slide.placeholders.update(tokens)
 
         # Step 2: Generate AI placeholders
-        if config.settings.enable_llm and not use_mock:
-            logger.info("🤖 Generating AI content...")
-            try:
-                # Use smart batched generation to avoid timeout issues
-                # Batching is based on estimated token count, not hardcoded limits
-                ai_placeholders = self._generate_ai_content_in_batches(
-                    tenant_input,
-                    template,
-                )
+        if use_mock or not config.settings.enable_llm:
+            logger.info("📝 %s, using fallback content", "Using mock mode" if use_mock else "LLM disabled")
+        elif not self._merge_ai_content(slidespec, tenant_input, template, computed):
+            logger.warning("⚠️ Falling back to placeholder text")
+
+        # Single fallback point for mock mode, disabled LLM, failed generation
+        # and slides left empty by a failed batch; filled tokens are kept
+        self._fill_ai_placeholders_with_fallback(slidespec, template)
+        logger.info("✅ V2 slidespec generation complete: %d slides", len(slidespec.slides))
+        return slidespec
 
-                # Merge AI content
-                for slide_key, tokens in ai_placeholders.items():
-                    slide = slidespec.get_slide(slide_key)
-                    if slide:
-                        slide.placeholders.update(tokens)
-
-                # Validate key numbers
-                errors = self._validate_key_numbers(slidespec, tenant_input, template)
-                if errors:
-                    logger.warning(f"⚠️ Validation warnings: {errors}")
-
-            except LLMGenerationError as e:
-                logger.error(f"❌ AI generation failed: {e}")
-                logger.warning("⚠️ Falling back to placeholder text")
-                self._fill_ai_placeholders_with_fallback(slidespec, template)
-        else:
-            logger.info(f"📝 {'Using mock mode' if use_mock else 'LLM disabled'}, using fallback content")
-            self._fill_ai_placeholders_with_fallback(slidespec, template)
+    def _merge_ai_content(
+        self,
+        slidespec: SlideSpecV2,
+        tenant_input: TenantInput,
+        template: TemplateDescriptorV2,
+        computed: Dict[str, Any],
+    ) -> bool:
+        """Generate AI placeholders into slidespec.
 
-        logger.info(f"✅ V2 slidespec generation complete: {len(slidespec.slides)} slides")
-        return slidespec
+        Returns:
+            True on success, False if generation failed and fallback is needed
+        """
+        logger.info("🤖 Generating AI content...")
+        try:
+            # Use smart batched generation to avoid timeout issues
+            # Batching is based on estimated token count, not hardcoded limits
+            ai_placeholders = self._generate_ai_content_in_batches(
+                tenant_input,
+                template,
+            )
+        except LLMGenerationError as e:
+            logger.error("❌ AI generation failed: %s", e)
+            return False
+
+        # Merge AI content
+        for slide_key, tokens in ai_placeholders.items():
+            slide = slidespec.get_slide(slide_key)
+            if slide:
+                slide.placeholders.update(tokens)
+
+        # Validate key numbers
+        errors = self._validate_key_numbers(slidespec, tenant_input, template, computed)
+        if errors:
+            logger.warning("⚠️ Validation warnings: %s", errors)
+        return True
 
     def _fill_ai_placeholders_with_fallback(
         self,
@@ -1032,8 +1515,9 @@ class LLMOrchestratorV2:
         template: TemplateDescriptorV2,
     ) -> None:
         """Fill AI placeholders with fallback text when LLM is unavailable."""
-        for slide_key, token, placeholder in template.get_ai_placeholders():
-            slide = slidespec.get_slide(slide_key)
+        for placeholder in template.get_ai_placeholders():
+            token = placeholder.token
+            slide = slidespec.get_slide(placeholder.parent_slide_key)
             if slide and token not in slide.placeholders:
                 if placeholder.type == "bullet_list":
                     slide.placeholders[token] = "• [AI生成内容占位]\n• [请启用LLM以生成实际内容]"
@@ -1045,6 +1529,13 @@ class LLMOrchestratorV2:
 # Legacy V1 Orchestrator (kept for backward compatibility)
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def _read_mock_slidespec(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a mock slidespec file; mtime_ns is part of the key so edits invalidate it."""
+    with open(path_str, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class LLMOrchestrator:
     """V1 Orchestrator - Legacy implementation for V1 templates."""
 
@@ -1066,10 +1557,11 @@ class LLMOrchestrator:
         audience = "management" if "management" in template_id else "technical"
         mock_file = f"{input_id}_{audience}_mock_slidespec.json"
         path = config.MOCK_OUTPUTS_DIR / mock_file
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise MockOutputNotFound(f"Mock slidespec {mock_file} not found")
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_mock_slidespec(str(path), mtime_ns)
         return SlideSpec.model_validate(data)
 
     def generate_slidespec(
@@ -1080,7 +1572,7 @@ class LLMOrchestrator:
         use_mock: bool = False,
     ) -> SlideSpec:
         """Generate slidespec using V1 logic (legacy)."""
-        logger.info(f"🎯 Generating V1 slidespec for {input_id}/{template_id}")
+        logger.info("🎯 Generating V1 slidespec for %s/%s", input_id, template_id)
 
         if use_mock:
             try:
@@ -1108,14 +1600,13 @@ class LLMOrchestrator:
         new_content: Dict[str, Any],
     ) -> SlideSpec:
         """Update a slide's data with new content."""
-        updated_slides = []
-        for slide in slide_spec.slides:
-            if slide.slide_key == slide_key:
-                updated_slides.append(SlideSpecItem(
-                    slide_no=slide.slide_no,
-                    slide_key=slide.slide_key,
-                    data={**slide.data, **new_content},
-                ))
-            else:
-                updated_slides.append(slide)
-        return SlideSpec(template_id=slide_spec.template_id, slides=updated_slides)
+        slides = list(slide_spec.slides)
+        idx = next((i for i, s in enumerate(slides) if s.slide_key == slide_key), None)
+        if idx is not None:
+            orig = slides[idx]
+            slides[idx] = SlideSpecItem(
+                slide_no=orig.slide_no,
+                slide_key=orig.slide_key,
+                data=orig.data | new_content,
+            )
+        return SlideSpec(template_id=slide_spec.template_id, slides=slides)
@@ -1,14 +1,167 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
+import os
+import re
+from collections import deque
+from copy import deepcopy
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional
+
+import orjson
 
 from mss_ai_ppt_sample_assets.backend.models.slidespec import SlideSpecV2
+from mss_ai_ppt_sample_assets.backend.models.templates import TemplateDescriptorV2
 from mss_ai_ppt_sample_assets.backend.modules.template_loader import TemplateRepository
 
 logger = logging.getLogger(__name__)
 
+# Severity keywords in match priority order: a category is assigned the first
+# severity whose keyword it contains (e.g. "高危(high)" -> high).
+_SEVERITY_KEYWORDS = (
+    ('critical', ('严重', 'critical')),
+    ('high', ('高危', 'high')),
+    ('medium', ('中危', 'medium')),
+    ('low', ('低危', 'low')),
+    ('info', ('信息', 'info')),
+)
+
+
+@lru_cache(maxsize=256)
+def _severity_of_category(category: str) -> Optional[str]:
+    """Map a chart category label to a severity key, or None if it names none."""
+    cat_lower = category.lower()
+    for severity, keywords in _SEVERITY_KEYWORDS:
+        for kw in keywords:
+            if kw in cat_lower:
+                return severity
+    return None
+
+
+@lru_cache(maxsize=8)
+def _read_template_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """Read a .pptx template; mtime_ns is part of the key so edits invalidate it.
+
+    Only the bytes are shared: each render opens its own Presentation from
+    them, since python-pptx mutates the presentation in place.
+    """
+    with open(path_str, "rb") as f:
+        return f.read()
+
+
+def _placeholder_text(value: Any) -> str:
+    """Normalize a text placeholder value: None -> "", lists -> one item per line."""
+    # Most values are already plain strings
+    if type(value) is str:
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(map(str, value))
+    return str(value)
+
+
+class _TextPlaceholders(dict):
+    """Slide text values by token, normalized to str on first lookup.
+
+    Values (e.g. bullet lists) for tokens that never occur in the slide are
+    never joined; a joined value is stored back for later shapes.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, token: str) -> str:
+        value = dict.__getitem__(self, token)
+        if type(value) is not str:
+            value = _placeholder_text(value)
+            dict.__setitem__(self, token, value)
+        return value
+
+
+# Shared read-only default for slides the descriptor has no entry for
+_NO_PLACEHOLDER_TYPES: Mapping[str, str] = MappingProxyType({})
+
+# Placeholder types rendered as native objects instead of text, in render order
+_OBJECT_PLACEHOLDER_TYPES = ('bar_chart', 'pie_chart', 'native_table')
+
+# Table cell text treated as numeric (centered): digits mixed with '.' and
+# '%', e.g. "250", "12.5%", "10.0.0.1"
+_NUMERIC_CELL_RE = re.compile(r"[\d.%]*\d[\d.%]*")
+
+
+# DrawingML text element (<a:t>), which holds the text of every run
+_A_T_TAG = "{http://schemas.openxmlformats.org/drawingml/2006/main}t"
+
+
+def _has_token_text(element) -> bool:
+    """Whether any <a:t> under an lxml element contains a "{{" token opener."""
+    return any(t.text and "{{" in t.text for t in element.iter(_A_T_TAG))
+
+
+@lru_cache(maxsize=256)
+def _token_pattern(tokens: tuple) -> re.Pattern:
+    """Compile one alternation matching {{TOKEN}} for any of the given tokens.
+
+    A slide's token set is fixed by its template, so patterns are reused
+    across renders.
+    """
+    return re.compile(r"\{\{(" + "|".join(map(re.escape, tokens)) + r")\}\}")
+
+
+# Renderer changes invalidate previously rendered decks
+_RENDERER_MTIME_NS = Path(__file__).stat().st_mtime_ns
+
+
+def _render_key(
+    slidespec: SlideSpecV2,
+    template_desc: TemplateDescriptorV2,
+    template_path: Path,
+    template_mtime_ns: int,
+) -> str:
+    """Digest of everything a rendered deck depends on.
+
+    That is the slidespec, the descriptor (theme and placeholder types pick
+    the rendering), the template .pptx and this renderer module.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{template_path}\0{template_mtime_ns}\0{_RENDERER_MTIME_NS}\0".encode("utf-8"))
+    digest.update(template_desc.model_dump_json().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(orjson.dumps(slidespec.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+def _render_key_path(output_path: Path) -> Path:
+    """Sidecar file holding the render key of the deck at output_path."""
+    return output_path.with_suffix(".hash")
+
+
+def _save_atomically(output_path: Path, write: Callable[[Path], None]) -> Path:
+    """Write output via a temp file and rename it over the target.
+
+    An existing report is replaced atomically and never left half-written.
+    Returns the path actually written.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        write(tmp_path)
+        try:
+            os.replace(tmp_path, output_path)
+        except OSError:
+            # Target is locked (e.g. open in PowerPoint on Windows)
+            output_path = output_path.with_name(output_path.stem + "_new" + output_path.suffix)
+            os.replace(tmp_path, output_path)
+    except BaseException:
+        # Don't leave a partial temp file beside the reports
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return output_path
+
 
 # Professional color palettes for charts and tables
 class ChartColors:
@@ -57,6 +210,7 @@ class ChartColors:
     # Theme-aware text colors
     TEXT_LIGHT_THEME = (51, 51, 51)        # #333333 for light backgrounds
     TEXT_DARK_THEME = (255, 255, 255)      # White for dark backgrounds
+    AXIS_TEXT_LIGHT_THEME = (71, 85, 105)  # #475569 Slate for light-theme axes
 
     # Dark theme table styles
     TABLE_HEADER_BG_DARK = (34, 197, 94)   # Green accent for dark theme
@@ -73,13 +227,12 @@ class PPTGeneratorV2:
 
     def __init__(self, template_repo: TemplateRepository):
         self.template_repo = template_repo
-        self._is_dark_theme = False  # Track current template theme
         try:
             from pptx import Presentation
             from pptx.util import Inches, Pt, Emu
             from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
-            from pptx.chart.data import CategoryChartData
             from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+            from pptx.shapes.group import GroupShape
             from pptx.dml.color import RGBColor
 
             self._Presentation = Presentation
@@ -89,42 +242,100 @@ class PPTGeneratorV2:
             self._XL_CHART_TYPE = XL_CHART_TYPE
             self._XL_LEGEND_POSITION = XL_LEGEND_POSITION
             self._XL_LABEL_POSITION = XL_LABEL_POSITION
-            self._CategoryChartData = CategoryChartData
             self._PP_ALIGN = PP_ALIGN
             self._MSO_ANCHOR = MSO_ANCHOR
+            self._GroupShape = GroupShape
             self._RGBColor = RGBColor
+            # Palette colors are few and RGBColor is an immutable tuple, so
+            # one instance per color is shared across cells, points and renders
+            self._rgb_cache: Dict[tuple, Any] = {}
         except ImportError as exc:
             raise RuntimeError(
                 "python-pptx is required for PPT rendering. Please install via requirements.txt."
             ) from exc
+        self._set_theme(dark=False)
+
+    @cached_property
+    def _CategoryChartData(self):
+        """Chart data class, imported on first chart render.
 
-    def _replace_tokens_in_shape(self, shape, mapping: Dict[str, str]) -> None:
-        """Replace {{TOKEN}} placeholders in shape text."""
+        Unlike the other python-pptx names it pulls in xlsxwriter (for the
+        embedded chart workbook), which text-only renders never need.
+        """
+        from pptx.chart.data import CategoryChartData
+        return CategoryChartData
+
+    def _set_theme(self, dark: bool) -> None:
+        """Record the current template theme and resolve its chart text colors."""
+        self._is_dark_theme = dark
+        if dark:
+            self._text_rgb = self._rgb(ChartColors.TEXT_DARK_THEME)
+            self._axis_text_rgb = self._text_rgb
+        else:
+            self._text_rgb = self._rgb(ChartColors.TEXT_LIGHT_THEME)
+            self._axis_text_rgb = self._rgb(ChartColors.AXIS_TEXT_LIGHT_THEME)
+
+    def _rgb(self, color: tuple):
+        """Return the shared RGBColor for an (r, g, b) tuple."""
+        rgb = self._rgb_cache.get(color)
+        if rgb is None:
+            rgb = self._rgb_cache[color] = self._RGBColor(*color)
+        return rgb
+
+    def _replace_tokens_in_shape(self, shape, pattern: re.Pattern, mapping: Mapping[str, str]) -> None:
+        """Replace {{TOKEN}} placeholders in shape text.
+
+        pattern matches every token in mapping (see _token_pattern), so each
+        run is scanned once and only rewritten when something matched.
+        """
         if not shape.has_text_frame:
             return
-        
-        shape_modified = False
-        for paragraph in shape.text_frame.paragraphs:
-            for run in paragraph.runs:
+
+        # Most shapes hold no tokens; check the raw <a:t> text before
+        # building paragraph/run proxies
+        if not _has_token_text(shape._element):
+            return
+
+        def substitute(match: re.Match) -> str:
+            return mapping[match.group(1)]
+
+        # text_frame builds a new proxy on every access; bind it (and the
+        # per-run callables) once for the loops below
+        text_frame = shape.text_frame
+        subn = pattern.subn
+        space_after = self._Pt(6)
+
+        for paragraph in text_frame.paragraphs:
+            paragraph_modified = False
+            # Track the post-replacement run text while walking the runs, so
+            # the formatting check below rarely needs paragraph.text
+            runs = paragraph.runs
+            text_len = 0
+            has_newline = False
+            for run in runs:
                 text = run.text
-                for token, value in mapping.items():
-                    placeholder = f"{{{{{token}}}}}"
-                    if placeholder in text:
-                        run.text = text.replace(placeholder, str(value) if value else "")
-                        text = run.text
-                        shape_modified = True
-            
+                if "{{" in text:
+                    text, count = subn(substitute, text)
+                    if count:
+                        run.text = text
+                        paragraph_modified = True
+                text_len += len(text)
+                has_newline = has_newline or '\n' in text
+
             # Apply formatting if modified and text is substantial (multiline or long)
             # This helps avoid "crowded" look for generated content
-            if shape_modified:
-                # Re-check text content after replacement
-                p_text = paragraph.text
-                if '\n' in p_text or len(p_text) > 50:
+            if paragraph_modified:
+                substantial = has_newline or text_len > 50
+                if not substantial and len(paragraph._p.content_children) > len(runs):
+                    # Line breaks and fields also count toward paragraph.text
+                    p_text = paragraph.text
+                    substantial = '\n' in p_text or len(p_text) > 50
+                if substantial:
                     paragraph.line_spacing = 1.25
-                    paragraph.space_after = self._Pt(6)
+                    paragraph.space_after = space_after
                     # Ensure wrapping is on for long text
-                    if shape.text_frame.word_wrap is None:
-                        shape.text_frame.word_wrap = True
+                    if text_frame.word_wrap is None:
+                        text_frame.word_wrap = True
 
     def _render_native_table(
         self,
@@ -161,7 +372,8 @@ class PPTGeneratorV2:
         # Create table
         left = self._Inches(position.get('left', 0.8))
         top = self._Inches(position.get('top', 2.5))
-        width = self._Inches(position.get('width', 8.5))
+        width_inches = position.get('width', 8.5)
+        width = self._Inches(width_inches)
         height = self._Inches(position.get('height', 3.0))
 
         table_shape = slide.shapes.add_table(num_rows, num_cols, left, top, width, height)
@@ -171,68 +383,104 @@ class PPTGeneratorV2:
         col_widths = table_data.get('col_widths', None)
         if col_widths:
             total_width = sum(col_widths)
+            Inches = self._Inches
+            columns = list(table.columns)
             for col_idx, cw in enumerate(col_widths):
-                table.columns[col_idx].width = self._Inches(cw * position.get('width', 8.5) / total_width)
+                columns[col_idx].width = Inches(cw * width_inches / total_width)
+
+        # Per-table styling values: fonts sizes and colors are immutable, so
+        # each is built once and shared by every cell
+        Pt = self._Pt
+        rgb = self._rgb
+        align_center = self._PP_ALIGN.CENTER
+        align_left = self._PP_ALIGN.LEFT
+        anchor_middle = self._MSO_ANCHOR.MIDDLE
 
         # Style headers (professional deep blue with white text)
-        header_bg = ChartColors.TABLE_HEADER_BG
-        header_text = ChartColors.TABLE_HEADER_TEXT
+        header_bg = rgb(ChartColors.TABLE_HEADER_BG)
+        header_text = rgb(ChartColors.TABLE_HEADER_TEXT)
+        header_size = Pt(11)
 
+        # Resolve the row proxies once; table.rows[i] rebuilds them per access
+        table_rows = list(table.rows)
+
+        header_cells = table_rows[0].cells
         for col_idx, header in enumerate(headers):
-            cell = table.rows[0].cells[col_idx]
+            cell = header_cells[col_idx]
             cell.text = str(header)
 
             # Header background
             cell.fill.solid()
-            cell.fill.fore_color.rgb = self._RGBColor(*header_bg)
+            cell.fill.fore_color.rgb = header_bg
 
             # Header text styling
             paragraph = cell.text_frame.paragraphs[0]
-            paragraph.font.bold = True
-            paragraph.font.size = self._Pt(11)
-            paragraph.font.color.rgb = self._RGBColor(*header_text)
-            paragraph.font.name = "微软雅黑"
-            paragraph.alignment = self._PP_ALIGN.CENTER
+            font = paragraph.font
+            font.bold = True
+            font.size = header_size
+            font.color.rgb = header_text
+            font.name = "微软雅黑"
+            paragraph.alignment = align_center
 
             # Vertical alignment
-            cell.vertical_anchor = self._MSO_ANCHOR.MIDDLE
+            cell.vertical_anchor = anchor_middle
 
         # Style data rows with alternating colors
+        row_backgrounds = (
+            rgb(ChartColors.TABLE_ROW_NORMAL),
+            rgb(ChartColors.TABLE_ROW_ALT),
+        )
+        cell_size = Pt(10)
+        cell_text = rgb((30, 41, 59))  # Slate-800
+        # Data cells only come in four styles (row parity x alignment). The
+        # first cell of each style is styled through python-pptx; later ones
+        # get deep copies of its <a:pPr>/<a:tcPr> instead of repeating the
+        # per-property proxy calls
+        style_protos: Dict[tuple, tuple] = {}
         for row_idx, row_data in enumerate(rows):
             # Alternating row colors for better readability
-            if row_idx % 2 == 0:
-                row_bg = ChartColors.TABLE_ROW_NORMAL
-            else:
-                row_bg = ChartColors.TABLE_ROW_ALT
+            parity = row_idx % 2
+            row_cells = table_rows[row_idx + 1].cells
 
             for col_idx, cell_value in enumerate(row_data):
                 if col_idx < num_cols:
-                    cell = table.rows[row_idx + 1].cells[col_idx]
+                    cell = row_cells[col_idx]
 
                     # Format cell value
                     display_value = str(cell_value) if cell_value is not None else ""
                     cell.text = display_value
 
+                    # Center numeric columns, left-align text
+                    is_numeric = isinstance(cell_value, (int, float)) or (
+                        isinstance(cell_value, str) and _NUMERIC_CELL_RE.fullmatch(cell_value) is not None
+                    )
+
+                    tc = cell._tc
+                    proto = style_protos.get((parity, is_numeric))
+                    if proto is not None:
+                        ppr, tcpr = proto
+                        tc.txBody.p_lst[0].insert(0, deepcopy(ppr))
+                        tc.replace(tc.get_or_add_tcPr(), deepcopy(tcpr))
+                        continue
+
                     # Row background
                     cell.fill.solid()
-                    cell.fill.fore_color.rgb = self._RGBColor(*row_bg)
+                    cell.fill.fore_color.rgb = row_backgrounds[parity]
 
                     # Data cell text styling
                     paragraph = cell.text_frame.paragraphs[0]
-                    paragraph.font.size = self._Pt(10)
-                    paragraph.font.name = "微软雅黑"
-                    paragraph.font.color.rgb = self._RGBColor(30, 41, 59)  # Slate-800
-
-                    # Center numeric columns, left-align text
-                    if isinstance(cell_value, (int, float)) or (isinstance(cell_value, str) and cell_value.replace('.', '').replace('%', '').isdigit()):
-                        paragraph.alignment = self._PP_ALIGN.CENTER
-                    else:
-                        paragraph.alignment = self._PP_ALIGN.LEFT
+                    font = paragraph.font
+                    font.size = cell_size
+                    font.name = "微软雅黑"
+                    font.color.rgb = cell_text
+                    paragraph.alignment = align_center if is_numeric else align_left
 
                     # Vertical alignment
-                    cell.vertical_anchor = self._MSO_ANCHOR.MIDDLE
+                    cell.vertical_anchor = anchor_middle
 
-        logger.info(f"Rendered professional table: {num_rows} rows x {num_cols} cols")
+                    style_protos[(parity, is_numeric)] = (tc.txBody.p_lst[0].pPr, tc.tcPr)
+
+        logger.info("Rendered professional table: %d rows x %d cols", num_rows, num_cols)
 
     def _render_bar_chart(
         self,
@@ -284,30 +532,32 @@ class PPTGeneratorV2:
         )
         chart = chart_shape.chart
 
-        # Use theme-aware text color
-        text_color = ChartColors.TEXT_DARK_THEME if self._is_dark_theme else ChartColors.TEXT_LIGHT_THEME
-        axis_text_color = ChartColors.TEXT_DARK_THEME if self._is_dark_theme else (71, 85, 105)  # Slate-500 for light theme
+        # Theme-aware text colors, resolved once per render by _set_theme
+        text_rgb = self._text_rgb
+        axis_text_rgb = self._axis_text_rgb
 
         # Enhanced styling
         # Set chart title if provided
         if 'title' in chart_data and chart_data['title']:
             chart.has_title = True
-            chart.chart_title.text_frame.text = chart_data['title']
-            chart.chart_title.text_frame.paragraphs[0].font.size = self._Pt(14)
-            chart.chart_title.text_frame.paragraphs[0].font.bold = True
-            chart.chart_title.text_frame.paragraphs[0].font.color.rgb = self._RGBColor(*text_color)
+            title_frame = chart.chart_title.text_frame
+            title_frame.text = chart_data['title']
+            title_font = title_frame.paragraphs[0].font
+            title_font.size = self._Pt(14)
+            title_font.bold = True
+            title_font.color.rgb = text_rgb
 
         # Style the series with professional colors
         for idx, series in enumerate(chart.series):
             color = ChartColors.MULTI_SERIES[idx % len(ChartColors.MULTI_SERIES)]
             series.format.fill.solid()
-            series.format.fill.fore_color.rgb = self._RGBColor(*color)
+            series.format.fill.fore_color.rgb = self._rgb(color)
 
             # Add data labels
             series.has_data_labels = True
             data_labels = series.data_labels
             data_labels.font.size = self._Pt(9)
-            data_labels.font.color.rgb = self._RGBColor(*text_color)
+            data_labels.font.color.rgb = text_rgb
             data_labels.number_format = '#,##0'
 
         # Configure legend
@@ -316,20 +566,20 @@ class PPTGeneratorV2:
             chart.legend.position = self._XL_LEGEND_POSITION.BOTTOM
             chart.legend.include_in_layout = False
             chart.legend.font.size = self._Pt(10)
-            chart.legend.font.color.rgb = self._RGBColor(*text_color)
+            chart.legend.font.color.rgb = text_rgb
 
         # Style category axis
         category_axis = chart.category_axis
         category_axis.tick_labels.font.size = self._Pt(10)
-        category_axis.tick_labels.font.color.rgb = self._RGBColor(*axis_text_color)
+        category_axis.tick_labels.font.color.rgb = axis_text_rgb
 
         # Style value axis
         value_axis = chart.value_axis
         value_axis.tick_labels.font.size = self._Pt(9)
-        value_axis.tick_labels.font.color.rgb = self._RGBColor(*axis_text_color)
+        value_axis.tick_labels.font.color.rgb = axis_text_rgb
         value_axis.has_major_gridlines = True
 
-        logger.info(f"Rendered professional bar chart with {len(categories)} categories and {len(series_list)} series")
+        logger.info("Rendered professional bar chart with %d categories and %d series", len(categories), len(series_list))
 
     def _render_pie_chart(
         self,
@@ -377,43 +627,35 @@ class PPTGeneratorV2:
         )
         chart = chart_shape.chart
 
-        # Use theme-aware text color
-        text_color = ChartColors.TEXT_DARK_THEME if self._is_dark_theme else ChartColors.TEXT_LIGHT_THEME
+        # Theme-aware text color, resolved once per render by _set_theme
+        text_rgb = self._text_rgb
 
         # Enhanced styling
         # Set chart title if provided
         if 'title' in chart_data and chart_data['title']:
             chart.has_title = True
-            chart.chart_title.text_frame.text = chart_data['title']
-            chart.chart_title.text_frame.paragraphs[0].font.size = self._Pt(14)
-            chart.chart_title.text_frame.paragraphs[0].font.bold = True
-            chart.chart_title.text_frame.paragraphs[0].font.color.rgb = self._RGBColor(*text_color)
+            title_frame = chart.chart_title.text_frame
+            title_frame.text = chart_data['title']
+            title_font = title_frame.paragraphs[0].font
+            title_font.size = self._Pt(14)
+            title_font.bold = True
+            title_font.color.rgb = text_rgb
 
         # Get color scheme - use severity colors if categories match severity levels
-        severity_keywords = ['严重', '高危', '中危', '低危', '信息', 'critical', 'high', 'medium', 'low', 'info']
-        use_severity_colors = any(kw in str(cat).lower() for cat in categories for kw in severity_keywords)
+        severities = [_severity_of_category(str(cat)) for cat in categories]
+        use_severity_colors = any(sev is not None for sev in severities)
 
         # Style pie slices with professional colors
         plot = chart.plots[0]
         for idx, point in enumerate(plot.series[0].points):
             if use_severity_colors:
                 # Map category to severity color
-                cat_lower = str(categories[idx]).lower()
-                if '严重' in cat_lower or 'critical' in cat_lower:
-                    color = ChartColors.SEVERITY['critical']
-                elif '高危' in cat_lower or 'high' in cat_lower:
-                    color = ChartColors.SEVERITY['high']
-                elif '中危' in cat_lower or 'medium' in cat_lower:
-                    color = ChartColors.SEVERITY['medium']
-                elif '低危' in cat_lower or 'low' in cat_lower:
-                    color = ChartColors.SEVERITY['low']
-                else:
-                    color = ChartColors.SEVERITY['info']
+                color = ChartColors.SEVERITY[severities[idx] or 'info']
             else:
                 color = ChartColors.MULTI_SERIES[idx % len(ChartColors.MULTI_SERIES)]
 
             point.format.fill.solid()
-            point.format.fill.fore_color.rgb = self._RGBColor(*color)
+            point.format.fill.fore_color.rgb = self._rgb(color)
 
         # Add data labels with percentages
         plot.has_data_labels = True
@@ -422,7 +664,7 @@ class PPTGeneratorV2:
         data_labels.show_percentage = True
         data_labels.show_value = False
         data_labels.font.size = self._Pt(10)
-        data_labels.font.color.rgb = self._RGBColor(*text_color)
+        data_labels.font.color.rgb = text_rgb
         data_labels.number_format = '0.0%'
 
         # Configure legend
@@ -430,9 +672,9 @@ class PPTGeneratorV2:
         chart.legend.position = self._XL_LEGEND_POSITION.RIGHT
         chart.legend.include_in_layout = False
         chart.legend.font.size = self._Pt(10)
-        chart.legend.font.color.rgb = self._RGBColor(*text_color)
+        chart.legend.font.color.rgb = text_rgb
 
-        logger.info(f"Rendered professional pie chart with {len(categories)} categories")
+        logger.info("Rendered professional pie chart with %d categories", len(categories))
 
     def _process_chart_placeholder(
         self,
@@ -453,7 +695,7 @@ class PPTGeneratorV2:
             True if chart was rendered, False otherwise
         """
         if not isinstance(value, dict):
-            logger.warning(f"Chart placeholder {token} has invalid data type: {type(value)}")
+            logger.warning("Chart placeholder %s has invalid data type: %s", token, type(value))
             return False
 
         try:
@@ -462,11 +704,11 @@ class PPTGeneratorV2:
             elif chart_type == 'pie_chart':
                 self._render_pie_chart(slide, value, value.get('position'))
             else:
-                logger.warning(f"Unknown chart type: {chart_type}")
+                logger.warning("Unknown chart type: %s", chart_type)
                 return False
             return True
         except Exception as e:
-            logger.error(f"Failed to render {chart_type} for {token}: {e}")
+            logger.error("Failed to render %s for %s: %s", chart_type, token, e)
             return False
 
     def _process_table_placeholder(
@@ -486,14 +728,14 @@ class PPTGeneratorV2:
             True if table was rendered, False otherwise
         """
         if not isinstance(value, dict):
-            logger.warning(f"Table placeholder {token} has invalid data type: {type(value)}")
+            logger.warning("Table placeholder %s has invalid data type: %s", token, type(value))
             return False
 
         try:
             self._render_native_table(slide, value, value.get('position'))
             return True
         except Exception as e:
-            logger.error(f"Failed to render table for {token}: {e}")
+            logger.error("Failed to render table for %s: %s", token, e)
             return False
 
     def render(self, slidespec: SlideSpecV2, output_path: Path) -> Path:
@@ -507,80 +749,110 @@ class PPTGeneratorV2:
             Path to the saved PPTX file
         """
         template_path = self.template_repo.get_pptx_path(slidespec.template_id)
-        prs = self._Presentation(template_path)
+        template_mtime_ns = template_path.stat().st_mtime_ns
 
-        # Load template descriptor to get placeholder types
+        # Load template descriptor to get theme and placeholder types
         template_desc = self.template_repo.get_descriptor_v2(slidespec.template_id)
 
+        # Skip rendering when the deck on disk came from the same slidespec,
+        # template and renderer (e.g. a rewrite that changed nothing)
+        render_key = _render_key(slidespec, template_desc, template_path, template_mtime_ns)
+        key_path = _render_key_path(output_path)
+        try:
+            if output_path.exists() and key_path.read_text(encoding="utf-8") == render_key:
+                return output_path
+        except OSError:
+            pass
+
+        template_bytes = _read_template_bytes(str(template_path), template_mtime_ns)
+        if not slidespec.slides:
+            # Nothing to fill: the deck is the template itself
+            return self._save_deck(output_path, lambda tmp: tmp.write_bytes(template_bytes), render_key)
+
+        prs = self._Presentation(io.BytesIO(template_bytes))
+
         # Detect theme from template descriptor style
-        self._is_dark_theme = template_desc.style.get('theme', 'light') == 'dark'
+        self._set_theme(dark=template_desc.style.get('theme', 'light') == 'dark')
 
-        # Build mapping: slide_key -> placeholder_definitions
-        placeholder_types = {}
-        for slide_def in template_desc.slides:
-            placeholder_types[slide_def.slide_key] = {
-                ph.token: ph.type for ph in slide_def.placeholders
-            }
+        # slide_key -> {token: placeholder type}, cached on the descriptor
+        placeholder_types = template_desc.placeholder_types_by_slide
 
-        # Build mapping: slide_no -> placeholders dict
-        slides_by_no = {s.slide_no: s for s in slidespec.slides}
+        # Resolve slide parts once; indexing prs.slides re-walks the slide id
+        # list and relationships on every access
+        pptx_slides = list(prs.slides)
 
-        for slide_no, slide_content in slides_by_no.items():
-            if slide_no > len(prs.slides):
+        for slide_content in slidespec.slides:
+            slide_no = slide_content.slide_no
+            if slide_no > len(pptx_slides):
                 continue
 
             # pptx slides are 0-indexed
-            pptx_slide = prs.slides[slide_no - 1]
+            pptx_slide = pptx_slides[slide_no - 1]
 
             # Get placeholder types for this slide
-            slide_types = placeholder_types.get(slide_content.slide_key, {})
-
-            # Separate placeholders by type
-            text_placeholders = {}
-            chart_bar_placeholders = []
-            chart_pie_placeholders = []
-            table_placeholders = []
-
-            for token, value in slide_content.placeholders.items():
-                ph_type = slide_types.get(token, 'text')
-
-                if ph_type in ('bar_chart',):
-                    chart_bar_placeholders.append((token, value))
-                elif ph_type in ('pie_chart',):
-                    chart_pie_placeholders.append((token, value))
-                elif ph_type in ('native_table',):
-                    table_placeholders.append((token, value))
-                else:
-                    # Regular text placeholder
-                    if value is None:
-                        value = ""
-                    elif isinstance(value, list):
-                        # Join list items with newlines
-                        value = "\n".join(str(v) for v in value)
-                    text_placeholders[token] = str(value)
+            slide_types = placeholder_types.get(slide_content.slide_key, _NO_PLACEHOLDER_TYPES)
+
+            # Separate placeholders by type: chart/table values go to their
+            # bucket, anything else (including unknown tokens) is text
+            object_placeholders: Dict[str, List[tuple]] = {
+                ph_type: [] for ph_type in _OBJECT_PLACEHOLDER_TYPES
+            }
+            if slide_types:
+                text_placeholders = _TextPlaceholders()
+                for token, value in slide_content.placeholders.items():
+                    bucket = object_placeholders.get(slide_types.get(token))
+                    if bucket is None:
+                        text_placeholders[token] = value
+                    else:
+                        bucket.append((token, value))
+            else:
+                text_placeholders = _TextPlaceholders(slide_content.placeholders)
 
             # Replace text tokens in all shapes
-            for shape in pptx_slide.shapes:
-                self._replace_tokens_in_shape(shape, text_placeholders)
+            # One lxml scan of the slide part decides whether any shape
+            # needs the proxy-based replacement at all
+            if text_placeholders and _has_token_text(pptx_slide._element):
+                pattern = _token_pattern(tuple(text_placeholders))
+                # Breadth-first walk so shapes nested in groups are covered too
+                # (isinstance, since shape_type raises on unrecognized autoshapes)
+                group_cls = self._GroupShape
+                pending = deque(pptx_slide.shapes)
+                while pending:
+                    shape = pending.popleft()
+                    if isinstance(shape, group_cls):
+                        pending.extend(shape.shapes)
+                    else:
+                        self._replace_tokens_in_shape(shape, pattern, text_placeholders)
 
             # Render charts
-            for token, value in chart_bar_placeholders:
+            for token, value in object_placeholders['bar_chart']:
                 self._process_chart_placeholder(pptx_slide, token, value, 'bar_chart')
 
-            for token, value in chart_pie_placeholders:
+            for token, value in object_placeholders['pie_chart']:
                 self._process_chart_placeholder(pptx_slide, token, value, 'pie_chart')
 
             # Render tables
-            for token, value in table_placeholders:
+            for token, value in object_placeholders['native_table']:
                 self._process_table_placeholder(pptx_slide, token, value)
 
-        # Save output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        if output_path.exists():
-            try:
-                output_path.unlink()
-            except OSError:
-                output_path = output_path.with_name(output_path.stem + "_new" + output_path.suffix)
+        return self._save_deck(output_path, prs.save, render_key)
+
+    @staticmethod
+    def _save_deck(output_path: Path, write: Callable[[Path], None], render_key: str) -> Path:
+        """Save the deck atomically, then record its render key beside it.
 
-        prs.save(output_path)
-        return output_path
\ No newline at end of file
+        The old key is removed before the deck is replaced and the new one
+        is written only after the rename, so a failed or interrupted save
+        costs a re-render but never pairs a key with a different deck.
+        """
+        key_path = _render_key_path(output_path)
+        key_path.unlink(missing_ok=True)
+        saved_path = _save_atomically(output_path, write)
+        if saved_path != output_path:
+            # Fallback name for a locked target; only output_path is checked
+            return saved_path
+        try:
+            key_path.write_text(render_key, encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to write render key for %s: %s", output_path.name, e)
+        return saved_path
\ No newline at end of file
@@ -15,13 +15,12 @@ class PreviewGenerationError(Exception):
 
 INVALID_FS_CHARS = [":", "*", "?", "\"", "<", ">", "|"]
 
+# Invalid characters plus path separators all map to "_" in one pass
+_JOB_ID_TRANSLATION = str.maketrans(dict.fromkeys([*INVALID_FS_CHARS, "\\", "/"], "_"))
+
 
 def sanitize_job_id(job_id: str) -> str:
-    sanitized = job_id
-    for ch in INVALID_FS_CHARS:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("\\", "_").replace("/", "_")
-    return sanitized
+    return job_id.translate(_JOB_ID_TRANSLATION)
 
 
 class PPTPreviewGenerator:
@@ -128,9 +127,9 @@ class PPTPreviewGenerator:
             if not result:
                 raise PreviewGenerationError("No images generated from PDF")
 
-            # Sort by numeric slide number to ensure correct order
-            # (slide1.png, slide2.png, ..., slide10.png instead of dictionary order)
-            return sorted(result, key=lambda p: int(p.stem.replace('slide', '')))
+            # Pages are enumerated in document order, so result is already in
+            # numeric slide order (slide1, slide2, ..., slide10) - no re-sort needed
+            return result
 
         except Exception as exc:
             raise PreviewGenerationError(
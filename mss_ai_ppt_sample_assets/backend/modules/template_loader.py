@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from mss_ai_ppt_sample_assets.backend.config import TEMPLATES_DIR
 from mss_ai_ppt_sample_assets.backend.models.templates import (
@@ -25,7 +25,8 @@ class TemplateRepository:
     def __init__(self, base_dir: Path = TEMPLATES_DIR):
         self.base_dir = base_dir
         self._catalog = self._load_catalog()
-        self._descriptor_cache: Dict[str, TemplateDescriptorV2] = {}
+        # template_id -> (descriptor file mtime_ns, descriptor)
+        self._descriptor_cache: Dict[str, Tuple[int, TemplateDescriptorV2]] = {}
 
     def clear_cache(self) -> None:
         """Clear the descriptor cache to reload templates from disk."""
@@ -58,18 +59,24 @@ class TemplateRepository:
         Raises:
             TemplateNotFoundError: If template not found
             ValueError: If template is not V2 format
-        """
-        if template_id in self._descriptor_cache:
-            return self._descriptor_cache[template_id]
 
+        Cached descriptors are reused until the descriptor file's mtime
+        changes, so edits on disk are picked up without clearing the cache.
+        """
         entry = self._get_catalog_entry(template_id)
         descriptor_path = self.base_dir / entry["descriptor_file"]
+        mtime_ns = descriptor_path.stat().st_mtime_ns
+
+        cached = self._descriptor_cache.get(template_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         descriptor = load_template_descriptor(descriptor_path)
 
         if not isinstance(descriptor, TemplateDescriptorV2):
             raise ValueError(f"Template {template_id} is not a V2 template")
 
-        self._descriptor_cache[template_id] = descriptor
+        self._descriptor_cache[template_id] = (mtime_ns, descriptor)
         return descriptor
 
     def get_pptx_path(self, template_id: str) -> Path:
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import reduce
+from operator import getitem
 from typing import Any, Dict, List, Optional
 
 from mss_ai_ppt_sample_assets.backend.models.slidespec import SlideSpecV2
 from mss_ai_ppt_sample_assets.backend.models.inputs import TenantInput
 
+# Number inside a rendered placeholder string ("12", "2.8", ".5"). search()
+# takes the first well-formed number prefix, so "1.2.3" reads as 1.2 and
+# "3." as 3. Also used by LLMOrchestratorV2's key-number check.
+NUMBER_RE = re.compile(r"\d+(?:\.\d+)?|\.\d+")
+
 
 @dataclass
 class ValidationResult:
@@ -36,6 +43,12 @@ class ValidatorV2:
         ("KPI_VULN_CRITICAL", "vulnerabilities.counts.critical", None),
         ("KPI_VULN_HIGH", "vulnerabilities.counts.high", None),
     ]
+    _key_tokens = frozenset(token for token, _, _ in KEY_FIELDS)
+    # KEY_FIELDS with input paths split into keys once, at class creation
+    _key_fields_compiled = tuple(
+        (token, tuple(input_path.split(".")) if input_path else None, computed_key)
+        for token, input_path, computed_key in KEY_FIELDS
+    )
 
     def __init__(self, tenant_input: TenantInput):
         self.tenant_input = tenant_input
@@ -43,21 +56,23 @@ class ValidatorV2:
 
     def _compute_derived_values(self) -> Dict[str, Any]:
         """Compute derived values from input data."""
-        incidents = self.tenant_input.get("incidents", []) or []
-        return {
-            "incidents_count": len(incidents),
-            "incidents_high_count": len([i for i in incidents if i.get("severity") == "high"]),
-        }
+        return self.tenant_input.incident_summary
 
     def _get_nested(self, data: Dict[str, Any], path: str) -> Any:
         """Get nested value using dot notation."""
-        current = data
-        for part in path.split("."):
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                return None
-        return current
+        return self._get_by_keys(data, path.split("."))
+
+    @staticmethod
+    def _get_by_keys(data: Dict[str, Any], keys) -> Any:
+        """Get nested value by an already split key sequence.
+
+        Input data is plain JSON, so subscripting anything but a dict with a
+        str key raises TypeError; a missing key or non-dict level is None.
+        """
+        try:
+            return reduce(getitem, keys, data)
+        except (KeyError, TypeError):
+            return None
 
     def _extract_number(self, value: Any) -> Optional[float]:
         """Extract number from a value (handles strings like '12414' or '2.8小时')."""
@@ -66,12 +81,9 @@ class ValidatorV2:
         if isinstance(value, (int, float)):
             return float(value)
         if isinstance(value, str):
-            numbers = re.findall(r'[\d.]+', value)
-            if numbers:
-                try:
-                    return float(numbers[0])
-                except ValueError:
-                    pass
+            match = NUMBER_RE.search(value)
+            if match:
+                return float(match.group())
         return None
 
     def validate_key_numbers(self, slidespec: SlideSpecV2) -> ValidationResult:
@@ -85,13 +97,20 @@ class ValidatorV2:
         """
         issues: List[str] = []
         warnings: List[str] = []
+        raw = self.tenant_input.raw
+
+        # First occurrence of each key token across slides
+        actual_values: Dict[str, Any] = {}
+        for slide in slidespec.slides:
+            for token in self._key_tokens.intersection(slide.placeholders):
+                actual_values.setdefault(token, slide.placeholders[token])
 
-        for token, input_path, computed_key in self.KEY_FIELDS:
+        for token, input_keys, computed_key in self._key_fields_compiled:
             # Get expected value
             if computed_key:
                 expected = self._computed.get(computed_key)
-            elif input_path:
-                expected = self._get_nested(self.tenant_input, input_path)
+            elif input_keys:
+                expected = self._get_by_keys(raw, input_keys)
             else:
                 continue
 
@@ -103,18 +122,15 @@ class ValidatorV2:
                 continue
 
             # Find actual value in slidespec
-            for slide in slidespec.slides:
-                if token in slide.placeholders:
-                    actual = slide.placeholders[token]
-                    actual_num = self._extract_number(actual)
-
-                    if actual_num is not None:
-                        # Allow small floating point differences
-                        if abs(expected_num - actual_num) > 0.01:
-                            warnings.append(
-                                f"{token}: expected {expected_num}, got {actual_num}"
-                            )
-                    break
+            if token in actual_values:
+                actual_num = self._extract_number(actual_values[token])
+
+                if actual_num is not None:
+                    # Allow small floating point differences
+                    if abs(expected_num - actual_num) > 0.01:
+                        warnings.append(
+                            f"{token}: expected {expected_num}, got {actual_num}"
+                        )
 
         return ValidationResult(
             is_valid=len(issues) == 0,
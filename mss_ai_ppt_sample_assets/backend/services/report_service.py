@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Union
 
@@ -21,6 +22,16 @@ from mss_ai_ppt_sample_assets.backend.modules.preview_generator import (
 )
 
 
+@lru_cache(maxsize=32)
+def _read_tenant_input(path_str: str, mtime_ns: int) -> TenantInput:
+    """Parse a tenant input file; mtime_ns is part of the key so edits invalidate it.
+
+    Inputs are treated as read-only once loaded, so one parsed TenantInput
+    (with its cached summaries and prompt JSON) is shared across requests.
+    """
+    return TenantInput.load_from_file(Path(path_str))
+
+
 class InputNotFoundError(Exception):
     pass
 
@@ -75,7 +86,7 @@ class ReportService:
 
     def load_input(self, input_id: str) -> TenantInput:
         path = self._get_input_path(input_id)
-        return TenantInput.load_from_file(path)
+        return _read_tenant_input(str(path), path.stat().st_mtime_ns)
 
     def generate(
         self, input_id: str, template_id: str, use_mock: bool = False
@@ -100,8 +111,8 @@ class ReportService:
     ) -> Dict[str, Any]:
         """Generate report using V2 AI-driven flow."""
 
-        # Clear template cache to ensure latest descriptor is loaded
-        self.template_repo.clear_cache()
+        # TemplateRepository revalidates cached descriptors against file mtime,
+        # so edited descriptors are picked up without clearing the cache here.
 
         # V2: Direct to LLM with raw data
         slidespec: SlideSpecV2 = self.llm_orchestrator_v2.generate_slidespec_v2(
@@ -151,10 +162,7 @@ class ReportService:
         if not path.exists():
             raise SlideSpecNotFoundError(f"Slidespec for {input_id}/{template_id} not found, please generate first.")
 
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return SlideSpecV2.model_validate(data)
+        return SlideSpecV2.load_from_file(path)
 
     def rewrite(
         self, job_id: str, slide_key: str, new_content: Dict[str, Any]